@@ -4,13 +4,17 @@ Run with: streamlit run app.py
 """
 
 import streamlit as st
-from streamlit_autorefresh import st_autorefresh
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+import re
 import sys
 import os
+import time
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
@@ -18,9 +22,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 from database.db_manager import DatabaseManager
 from processors.data_processor import DataProcessor
 from processors.signal_detector import SignalDetector
-from scrapers.news_scraper import NewsScraper
 from utils.config import NEWS_SOURCES
 
+
+# Heavy optional imports are deferred until first use: plotly is only needed
+# when a Plotly chart is drawn, the scraper only when a collection runs.
+@lru_cache(maxsize=None)
+def _plotly():
+    """Return (plotly.express, plotly.graph_objects), importing them on first call."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return px, go
+
 # Page configuration
 st.set_page_config(
     page_title="Sri Lanka Business Intelligence",
@@ -32,635 +45,89 @@ st.set_page_config(
 # Auto-refresh every 5 minutes for real-time updates
 AUTO_REFRESH_INTERVAL = 300  # seconds
 
+# Minimum gap between checks for rows stored without processing (e.g. by an external writer)
+UNPROCESSED_CHECK_SECONDS = 30
+
+# Above this many hour/category points the timeline chart switches to 6-hour buckets
+TIMELINE_MAX_POINTS = 2000
+
+# Refresh interval choices (label -> milliseconds for st_autorefresh)
+INTERVAL_MS = {
+    "1 minute": 60000,
+    "5 minutes": 300000,
+    "15 minutes": 900000,
+    "30 minutes": 1800000,
+    "1 hour": 3600000,
+}
+
+# Static page chrome, built once at import
+_SECTION_HDR_TMPL = '<div class="section-header">{}</div>'
+_SIDEBAR_SEP = '<div style="margin: 10px 0; border-top: 2px solid rgba(102, 126, 234, 0.4); box-shadow: 0 1px 8px rgba(102, 126, 234, 0.3);"></div>'
+_SIDEBAR_THIN_SEP = '<div style="margin: 8px 0; border-top: 1px solid rgba(255,255,255,0.2);"></div>'
+_SIDEBAR_HDR_TMPL = '<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 2px 8px rgba(0,0,0,0.6), 0 1px 3px rgba(102, 126, 234, 0.4); letter-spacing: 0.3px;">{}</p>'
+_SIDEBAR_BANNER_HTML = """
+    <div style="text-align: center; padding: 14px 12px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%); backdrop-filter: blur(25px) saturate(180%); -webkit-backdrop-filter: blur(25px) saturate(180%); border-radius: 24px; margin-bottom: 24px; border: 2px solid rgba(255, 255, 255, 0.25); box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.3), 0 0 20px rgba(102, 126, 234, 0.2), inset 0 2px 0 rgba(255, 255, 255, 0.3);">
+        <h2 style="color: white; margin: 0; font-size: 28px; font-weight: 900; text-shadow: 0 3px 12px rgba(0,0,0,0.5), 0 1px 3px rgba(102, 126, 234, 0.5); letter-spacing: -0.5px;">Sri Lanka Business Intelligence</h2>
+        <p style="color: rgba(255,255,255,0.95); font-size: 15px; margin-top: 10px; font-weight: 600; text-shadow: 0 2px 6px rgba(0,0,0,0.4);">Real-Time Situational Awareness & Strategic Decision Support</p>
+    </div>
+    <p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 3px 12px rgba(0,0,0,0.9), 0 1px 4px rgba(102, 126, 234, 0.6); letter-spacing: 0.3px;">News Sources</p>
+"""
+_ABOUT_HTML = """
+    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%); backdrop-filter: blur(20px) saturate(160%); -webkit-backdrop-filter: blur(20px) saturate(160%); padding: 18px; border-radius: 12px; color: rgba(255, 255, 255, 0.96); font-size: 15px; line-height: 1.7; border: 1.5px solid rgba(255, 255, 255, 0.25); box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), 0 0 20px rgba(102, 126, 234, 0.2), inset 0 1px 0 rgba(255, 255, 255, 0.2); font-weight: 600; text-shadow: 0 1px 4px rgba(0,0,0,0.4);">
+        Real-time situational awareness platform providing actionable intelligence for Sri Lankan businesses through advanced data analytics.
+    </div>
+"""
+
+# Risk severity -> card/badge colour (unknown severities render as low)
+SEVERITY_COLOR = {"high": "#ef4444", "medium": "#f59e0b", "low": "#10b981"}
+
+# Article category -> card badge colour
+CATEGORY_COLOR = {
+    'economy': '#2563eb',
+    'politics': '#dc2626',
+    'technology': '#059669',
+    'business': '#0891b2',
+    'general': '#64748b'
+}
+DEFAULT_CATEGORY_COLOR = '#757575'
+
+# Professional, non-overlapping windows; _TIME_WINDOWS[i] is (older bound, newer bound) in hours for _TIME_LABELS[i]
+_TIME_LABELS = (
+    "Live – Last 6 Hours",
+    "Live – Last 12 Hours",
+    "Live – Last 24 Hours",
+    "Recent – Last 48 Hours",
+    "Recent – Last 72 Hours",
+    "Week – Last 7 Days",
+    "Biweekly – Last 14 Days",
+    "Monthly – Last 30 Days",
+)
+_TIME_WINDOWS = ((6, 0), (12, 0), (24, 0), (48, 0), (72, 0), (168, 0), (336, 0), (720, 0))
+
 # Custom CSS - Professional UI with Corporate Color Palette
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    :root {
-        --primary-navy: #1a365d;
-        --primary-blue: #2563eb;
-        --accent-teal: #0891b2;
-        --success-green: #059669;
-        --warning-amber: #d97706;
-        --danger-red: #dc2626;
-        --neutral-50: #f8fafc;
-        --neutral-100: #f1f5f9;
-        --neutral-200: #e2e8f0;
-        --neutral-700: #334155;
-        --neutral-800: #1e293b;
-    }
-    
-    * {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    }
-    
-    @keyframes gradientFlow {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .main {
-        background: linear-gradient(-45deg, #1e3a8a, #2563eb, #3b82f6, #60a5fa, #0ea5e9);
-        background-size: 400% 400%;
-        animation: gradientFlow 30s ease infinite;
-        position: relative;
-    }
-    
-    .main::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: radial-gradient(circle at 20% 80%, rgba(37, 99, 235, 0.2) 0%, transparent 50%),
-                    radial-gradient(circle at 80% 20%, rgba(59, 130, 246, 0.2) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: 0;
-    }
-    
-    @keyframes glassShimmer {
-        0% { background-position: -200% center; }
-        100% { background-position: 200% center; }
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    .hero-banner {
-        background: linear-gradient(135deg, rgba(30, 58, 138, 0.9) 0%, rgba(37, 99, 235, 0.85) 100%);
-        backdrop-filter: blur(30px) saturate(180%) brightness(0.8);
-        -webkit-backdrop-filter: blur(30px) saturate(180%) brightness(0.8);
-        padding: 25px 30px;
-        border-radius: 20px;
-        margin-bottom: 16px;
-        box-shadow: 0 12px 40px 0 rgba(30, 58, 138, 0.7),
-                    0 0 40px rgba(59, 130, 246, 0.6),
-                    inset 0 2px 0 0 rgba(255, 255, 255, 0.3),
-                    inset 0 -2px 0 0 rgba(30, 58, 138, 0.4);
-        border: 2px solid rgba(255, 255, 255, 0.3);
-        text-align: center;
-        animation: fadeIn 0.8s ease-out, float 10s ease-in-out infinite;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .hero-banner::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        background-size: 200% 100%;
-        animation: glassShimmer 8s ease-in-out infinite;
-        pointer-events: none;
-    }
-    
-    .hero-title {
-        color: #ffffff !important;
-        font-size: 42px;
-        font-weight: 900;
-        margin: 0;
-        letter-spacing: -0.5px;
-        text-shadow: 0 8px 32px rgba(0,0,0,1), 0 4px 16px rgba(0,0,0,1), 0 2px 8px rgba(0,0,0,0.95), 0 0 40px rgba(255, 255, 255, 0.9), 0 0 80px rgba(255, 255, 255, 0.6);
-        filter: drop-shadow(0 0 40px rgba(255, 255, 255, 0.8)) brightness(1.2);
-        -webkit-text-stroke: 0.5px rgba(255, 255, 255, 0.8);
-    }
-    
-    .hero-subtitle {
-        color: #ffffff !important;
-        font-size: 17px;
-        font-weight: 500;
-        margin-top: 12px;
-        letter-spacing: 0.5px;
-        text-shadow: 0 6px 20px rgba(0,0,0,1), 0 3px 10px rgba(0,0,0,0.95), 0 0 30px rgba(255, 255, 255, 0.8), 0 0 60px rgba(255, 255, 255, 0.5);
-        filter: drop-shadow(0 0 25px rgba(255, 255, 255, 0.7)) brightness(1.15);
-    }
-    
-    @keyframes liquidMove {
-        0%, 100% { border-radius: 20px 25px 20px 25px; }
-        50% { border-radius: 25px 20px 25px 20px; }
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%);
-        backdrop-filter: blur(20px) saturate(150%) brightness(1.05);
-        -webkit-backdrop-filter: blur(20px) saturate(150%) brightness(1.05);
-        padding: 16px;
-        border-radius: 20px;
-        margin: 10px 0;
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.6),
-                    inset 0 -1px 0 0 rgba(255, 255, 255, 0.2);
-        border: 2px solid rgba(255, 255, 255, 0.5);
-        border-left: 5px solid;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        animation: liquidMove 15s ease-in-out infinite;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card::after {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(255, 255, 255, 0.1) 0%, transparent 70%);
-        animation: rotate 40s linear infinite;
-        pointer-events: none;
-    }
-    
-    @keyframes rotate {
-        from { transform: rotate(0deg); }
-        to { transform: rotate(360deg); }
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 16px 48px 0 rgba(31, 38, 135, 0.4),
-                    0 0 20px rgba(255, 255, 255, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.8);
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.1) 100%);
-        border: 2px solid rgba(255, 255, 255, 0.7);
-    }
-    
-    .risk-high {
-        color: var(--danger-red);
-        font-weight: 700;
-        font-size: 15px;
-        border-left-color: var(--danger-red);
-    }
-    
-    .risk-medium {
-        color: var(--warning-amber);
-        font-weight: 700;
-        font-size: 15px;
-        border-left-color: var(--warning-amber);
-    }
-    
-    .risk-low {
-        color: var(--success-green);
-        font-weight: 700;
-        font-size: 15px;
-        border-left-color: var(--success-green);
-    }
-    
-    .opportunity-card {
-        border-left-color: var(--accent-teal);
-    }
-    
-    .stMetric {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%) !important;
-        backdrop-filter: blur(25px) saturate(150%) brightness(1.1);
-        -webkit-backdrop-filter: blur(25px) saturate(150%) brightness(1.1);
-        padding: 14px;
-        border-radius: 24px;
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.6),
-                    inset 0 -1px 0 0 rgba(255, 255, 255, 0.2);
-        border: 2px solid rgba(255, 255, 255, 0.5);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stMetric::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(255, 255, 255, 0.08) 0%, transparent 60%);
-        animation: rotate 35s linear infinite reverse;
-        pointer-events: none;
-    }
-    
-    .stMetric:hover {
-        transform: translateY(-6px) scale(1.03);
-        box-shadow: 0 16px 48px 0 rgba(31, 38, 135, 0.4),
-                    0 0 25px rgba(255, 255, 255, 0.4),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.8);
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.18) 0%, rgba(255, 255, 255, 0.12) 100%) !important;
-        border: 2px solid rgba(255, 255, 255, 0.7);
-    }
-    
-    .stMetric label {
-        color: white !important;
-        font-weight: 700 !important;
-        font-size: 15px !important;
-        letter-spacing: 0.3px !important;
-        text-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
-    }
-    
-    .stMetric [data-testid="stMetricValue"] {
-        color: white !important;
-        font-size: 38px !important;
-        font-weight: 900 !important;
-        text-shadow: 0 2px 12px rgba(0, 0, 0, 0.4);
-    }
-    
-    .stMetric [data-testid="stMetricDelta"] {
-        font-size: 14px !important;
-        font-weight: 600 !important;
-        text-shadow: 0 1px 4px rgba(0, 0, 0, 0.2);
-    }
-    
-    /* Main content area buttons - bright and visible */
-    .stButton button,
-    .main .stButton button,
-    [data-testid="stMainBlockContainer"] .stButton button {
-        background: linear-gradient(135deg, #f97316 0%, #ea580c 100%) !important;
-        color: white !important;
-        border: 2px solid #fdba74 !important;
-        border-radius: 10px !important;
-        font-weight: 700 !important;
-        font-size: 15px !important;
-        padding: 12px 24px !important;
-        transition: all 0.3s ease !important;
-        text-shadow: 0 1px 2px rgba(0,0,0,0.2) !important;
-        box-shadow: 0 4px 14px rgba(249, 115, 22, 0.4) !important;
-        min-height: 48px !important;
-    }
-    
-    .stButton button:hover,
-    .main .stButton button:hover,
-    [data-testid="stMainBlockContainer"] .stButton button:hover {
-        background: linear-gradient(135deg, #fb923c 0%, #f97316 100%) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 20px rgba(249, 115, 22, 0.5) !important;
-    }
-    
-    /* Markdown text visibility in main content */
-    .main .stMarkdown,
-    .main .stMarkdown p,
-    .main .stMarkdown h1,
-    .main .stMarkdown h2,
-    .main .stMarkdown h3,
-    .main .stMarkdown strong,
-    [data-testid="stMainBlockContainer"] .stMarkdown {
-        color: white !important;
-    }
-    
-    .main hr {
-        border-color: rgba(255, 255, 255, 0.3) !important;
-    }
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
 
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 12px;
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%);
-        backdrop-filter: blur(25px) saturate(150%);
-        -webkit-backdrop-filter: blur(25px) saturate(150%);
-        padding: 12px;
-        border-radius: 20px;
-        border: 2px solid rgba(255, 255, 255, 0.4);
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.5);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 14px;
-        padding: 14px 28px;
-        font-weight: 700;
-        font-size: 15px;
-        color: white;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        background: transparent;
-        text-shadow: 0 2px 6px rgba(0, 0, 0, 0.2);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.25) 0%, rgba(255, 255, 255, 0.15) 100%) !important;
-        backdrop-filter: blur(30px);
-        -webkit-backdrop-filter: blur(30px);
-        box-shadow: 0 4px 20px 0 rgba(255, 255, 255, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.8) !important;
-        color: white !important;
-        border: 2px solid rgba(255, 255, 255, 0.6);
-        text-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(15px);
-        -webkit-backdrop-filter: blur(15px);
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(255, 255, 255, 0.2);
-    }
-    
-    .stExpander {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%);
-        backdrop-filter: blur(20px) saturate(150%);
-        -webkit-backdrop-filter: blur(20px) saturate(150%);
-        border-radius: 18px;
-        margin-bottom: 8px;
-        border: 2px solid rgba(255, 255, 255, 0.4);
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.25),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.5);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
-    .stExpander summary {
-        color: white !important;
-        font-weight: 700 !important;
-        font-size: 15px !important;
-        text-shadow: 0 2px 6px rgba(0, 0, 0, 0.3);
-    }
-    
-    .stExpander:hover {
-        border-color: rgba(255, 255, 255, 0.6);
-        box-shadow: 0 12px 40px 0 rgba(31, 38, 135, 0.35),
-                    0 0 20px rgba(255, 255, 255, 0.2),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.7);
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%);
-        transform: translateY(-3px);
-    }
-    
-    @keyframes glow {
-        0%, 100% { text-shadow: 0 0 10px rgba(255, 255, 255, 0.5), 0 0 20px rgba(255, 255, 255, 0.3), 0 2px 8px rgba(0, 0, 0, 0.3); }
-        50% { text-shadow: 0 0 20px rgba(255, 255, 255, 0.8), 0 0 30px rgba(255, 255, 255, 0.5), 0 2px 8px rgba(0, 0, 0, 0.3); }
-    }
-    
-    .section-header {
-        font-size: 26px;
-        font-weight: 900;
-        color: white;
-        margin: 24px 0 18px 0;
-        padding-bottom: 16px;
-        border-bottom: 3px solid rgba(255, 255, 255, 0.4);
-        letter-spacing: -0.3px;
-        animation: glow 6s ease-in-out infinite;
-        position: relative;
-    }
-    
-    .section-header::after {
-        content: '';
-        position: absolute;
-        bottom: -3px;
-        left: 0;
-        width: 100%;
-        height: 3px;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.6), transparent);
-        animation: glassShimmer 5s ease-in-out infinite;
-    }
-    
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(-10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    div[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, rgba(30, 58, 138, 0.95) 0%, rgba(23, 37, 84, 0.98) 100%);
-        backdrop-filter: blur(40px) saturate(180%) brightness(1.1);
-        -webkit-backdrop-filter: blur(40px) saturate(180%) brightness(1.1);
-        border-right: 2px solid rgba(255, 255, 255, 0.25);
-        box-shadow: 4px 0 32px rgba(0, 0, 0, 0.5),
-                    inset 1px 0 0 rgba(255, 255, 255, 0.15);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    div[data-testid="stSidebar"]::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(255, 255, 255, 0.05) 0%, transparent 60%);
-        animation: rotate 50s linear infinite;
-        pointer-events: none;
-    }
-    
-    @media (max-width: 768px) {
-        div[data-testid="stSidebar"] {
-            width: 100% !important;
-        }
-    }
-    
-    div[data-testid="stSidebar"] .element-container {
-        color: white;
-    }
-    
-    div[data-testid="stSidebar"] .stSelectbox label,
-    div[data-testid="stSidebar"] .stMultiSelect label {
-        color: white !important;
-        font-weight: 700 !important;
-        font-size: 14px !important;
-        text-shadow: 0 2px 8px rgba(0,0,0,0.8);
-        margin-bottom: 8px !important;
-    }
-    
-    div[data-testid="stSidebar"] .stSelectbox > div > div,
-    div[data-testid="stSidebar"] .stMultiSelect > div > div {
-        background: linear-gradient(135deg, rgba(30, 35, 45, 0.95) 0%, rgba(25, 30, 40, 0.98) 100%) !important;
-        color: white !important;
-        border-radius: 14px !important;
-        border: 2px solid rgba(59, 130, 246, 0.5) !important;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.4),
-                    0 0 15px rgba(59, 130, 246, 0.3),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.15) !important;
-        font-weight: 600 !important;
-        backdrop-filter: blur(20px) saturate(150%) !important;
-        -webkit-backdrop-filter: blur(20px) saturate(150%) !important;
-        transition: all 0.3s ease !important;
-        padding: 8px 12px !important;
-    }
-    
-    div[data-testid="stSidebar"] .stMultiSelect > div > div:hover {
-        border-color: rgba(59, 130, 246, 0.8) !important;
-        box-shadow: 0 6px 24px rgba(0, 0, 0, 0.5),
-                    0 0 25px rgba(59, 130, 246, 0.5),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.25) !important;
-    }
-    
-    div[data-testid="stSidebar"] input {
-        color: white !important;
-        font-weight: 600 !important;
-        text-shadow: 0 1px 4px rgba(0,0,0,0.5);
-        font-size: 14px !important;
-    }
-    
-    div[data-testid="stSidebar"] input::placeholder {
-        color: rgba(255, 255, 255, 0.5) !important;
-        font-weight: 500 !important;
-    }
-    
-    div[data-testid="stSidebar"] [data-baseweb="select"] {
-        background: linear-gradient(135deg, rgba(30, 35, 45, 0.95) 0%, rgba(25, 30, 40, 0.98) 100%) !important;
-        border-radius: 14px !important;
-        backdrop-filter: blur(20px) saturate(150%) !important;
-        -webkit-backdrop-filter: blur(20px) saturate(150%) !important;
-    }
-    
-    div[data-testid="stSidebar"] [data-baseweb="select"]:hover {
-        background: linear-gradient(135deg, rgba(35, 40, 50, 0.98) 0%, rgba(30, 35, 45, 0.98) 100%) !important;
-        border-color: rgba(102, 126, 234, 0.8) !important;
-    }
-    
-    div[data-testid="stSidebar"] [data-baseweb="tag"] {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%) !important;
-        color: white !important;
-        font-weight: 700 !important;
-        font-size: 13px !important;
-        padding: 8px 16px !important;
-        border-radius: 12px !important;
-        box-shadow: 0 4px 16px rgba(239, 68, 68, 0.6),
-                    0 0 20px rgba(239, 68, 68, 0.3),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.4) !important;
-        backdrop-filter: blur(10px) !important;
-        -webkit-backdrop-filter: blur(10px) !important;
-        border: 1.5px solid rgba(255, 255, 255, 0.4) !important;
-        transition: all 0.3s ease !important;
-        margin: 4px 4px 4px 0 !important;
-        text-shadow: 0 2px 6px rgba(0, 0, 0, 0.4);
-    }
-    
-    div[data-testid="stSidebar"] [data-baseweb="tag"]:hover {
-        transform: scale(1.08);
-        box-shadow: 0 6px 20px rgba(239, 68, 68, 0.8),
-                    0 0 30px rgba(239, 68, 68, 0.5),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.6) !important;
-        background: linear-gradient(135deg, #f87171 0%, #ef4444 100%) !important;
-    }
-    
-    div[data-testid="stSidebar"] .stButton > button {
-        background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        font-weight: 700 !important;
-        font-size: 15px !important;
-        padding: 14px 24px !important;
-        transition: all 0.3s ease !important;
-        text-shadow: 0 1px 2px rgba(0,0,0,0.2);
-        box-shadow: 0 4px 14px rgba(34, 197, 94, 0.5) !important;
-        width: 100% !important;
-        min-height: 50px !important;
-        letter-spacing: 0.5px;
-        text-transform: uppercase;
-    }
-    
-    div[data-testid="stSidebar"] .stButton > button:hover {
-        background: linear-gradient(135deg, #4ade80 0%, #22c55e 100%) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 20px rgba(34, 197, 94, 0.6) !important;
-    }
-    
-    div[data-testid="stSidebar"] .stButton > button:active {
-        transform: translateY(0) !important;
-        box-shadow: 0 2px 8px rgba(34, 197, 94, 0.4) !important;
-    }
-    
-    @media (max-width: 768px) {
-        div[data-testid="stSidebar"] .stButton > button {
-            font-size: 14px !important;
-            padding: 14px 20px !important;
-            min-height: 48px !important;
-        }
-    }
-    
-    .status-badge {
-        display: inline-block;
-        padding: 6px 14px;
-        border-radius: 24px;
-        font-size: 12px;
-        font-weight: 600;
-        margin: 4px 0;
-        letter-spacing: 0.3px;
-    }
-    
-    .status-active {
-        background: var(--success-green);
-        color: white;
-    }
-    
-    .status-warning {
-        background: var(--warning-amber);
-        color: white;
-    }
-    
-    [data-testid="stHeader"] {
-        background: transparent;
-    }
-    
-    hr {
-        border-color: var(--neutral-200);
-    }
-    
-    .stAlert {
-        border-radius: 18px;
-        border: 2px solid rgba(255, 255, 255, 0.4);
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%);
-        backdrop-filter: blur(25px) saturate(150%);
-        -webkit-backdrop-filter: blur(25px) saturate(150%);
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.6);
-        font-weight: 600;
-        font-size: 14px;
-        color: white;
-    }
-    
-    .element-container {
-        color: #1e293b;
-    }
-    
-    p, span, div {
-        color: inherit;
-    }
-    
-    .stDataFrame {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%) !important;
-        backdrop-filter: blur(25px) saturate(150%);
-        -webkit-backdrop-filter: blur(25px) saturate(150%);
-        border-radius: 18px;
-        border: 2px solid rgba(255, 255, 255, 0.4);
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.3),
-                    inset 0 1px 0 0 rgba(255, 255, 255, 0.5);
-    }
-    
-    .stDataFrame table {
-        font-size: 14px !important;
-        color: white !important;
-    }
-    
-    .stDataFrame thead tr th {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.2) 0%, rgba(255, 255, 255, 0.1) 100%) !important;
-        color: white !important;
-        font-weight: 800 !important;
-        font-size: 14px !important;
-        padding: 14px 12px !important;
-        border-bottom: 2px solid rgba(255, 255, 255, 0.3) !important;
-        text-shadow: 0 2px 6px rgba(0, 0, 0, 0.3);
-    }
-    
-    .stDataFrame tbody tr {
-        background: rgba(255, 255, 255, 0.05) !important;
-    }
-    
-    .stDataFrame tbody tr:hover {
-        background: rgba(255, 255, 255, 0.12) !important;
-    }
-    
-    .stDataFrame tbody tr td {
-        color: white !important;
-        font-weight: 600 !important;
-        padding: 12px !important;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1) !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace/semicolons (selector descendant spaces are kept)."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+@st.cache_data(ttl=None, show_spinner=False)
+def _load_css():
+    """Read and minify the dashboard stylesheet once per process; reruns reuse the cached string."""
+    with open(os.path.join(ASSETS_DIR, 'styles.css'), encoding='utf-8') as f:
+        return f"<style>{_minify_css(f.read())}</style>"
+
+
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 # Initialize database and processors
-@st.cache_resource(ttl=300)  # Refresh cache every 5 minutes
+@st.cache_resource  # Built once per server process; data is re-queried on each run
 def init_system():
     db = DatabaseManager()
     processor = DataProcessor(db=db)
@@ -669,81 +136,142 @@ def init_system():
 
 db, processor, detector = init_system()
 
-# Sidebar
-st.sidebar.markdown("""
-    <div style="text-align: center; padding: 14px 12px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%); backdrop-filter: blur(25px) saturate(180%); -webkit-backdrop-filter: blur(25px) saturate(180%); border-radius: 24px; margin-bottom: 24px; border: 2px solid rgba(255, 255, 255, 0.25); box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.3), 0 0 20px rgba(102, 126, 234, 0.2), inset 0 2px 0 rgba(255, 255, 255, 0.3);">
-        <h2 style="color: white; margin: 0; font-size: 28px; font-weight: 900; text-shadow: 0 3px 12px rgba(0,0,0,0.5), 0 1px 3px rgba(102, 126, 234, 0.5); letter-spacing: -0.5px;">Sri Lanka Business Intelligence</h2>
-        <p style="color: rgba(255,255,255,0.95); font-size: 15px; margin-top: 10px; font-weight: 600; text-shadow: 0 2px 6px rgba(0,0,0,0.4);">Real-Time Situational Awareness & Strategic Decision Support</p>
-    </div>
-""", unsafe_allow_html=True)
+
+@st.cache_resource  # One worker per server process: at most one auto-collect scrape in flight
+def get_collection_executor():
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="auto-collect")
+
+
+def _run_scrape():
+    """Scrape all sources off the script thread; the scraper owns its own DB session."""
+    from scrapers.news_scraper import NewsScraper
+    scraper = NewsScraper()
+    try:
+        return scraper.scrape_all()
+    finally:
+        scraper.close()
+
+# One timestamp per script run, reused by every "started/last updated" label
+now = datetime.now()
+now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+
+# Get data - memoised per (window, sources, window digest). The digest changes
+# whenever rows in the window are added, age out or get processed (including by
+# the scheduler), so unchanged refresh ticks reuse the cached result; collection
+# paths also clear it. The ttl only bounds memory and must be the same for every
+# session: Streamlit rebuilds a function's cache whenever its ttl changes.
+_DASHBOARD_CACHE_TTL = 600  # seconds
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False, max_entries=32)
+def get_dashboard_data(hours_start, hours_end, selected_sources_tuple, window_digest=None):
+    # Convert tuple back to list for filtering
+    selected_sources = list(selected_sources_tuple) if selected_sources_tuple else []
+    # Pass sources to database for accurate filtering at DB level
+    sources_filter = selected_sources if selected_sources else None
+    
+    # Uses the shared init_system() instances (process-wide, never closed here).
+    # Detached ArticleRecord tuples (loaded column-wise) so the cached result pickles cleanly
+    articles = db.get_recent_records(hours=hours_start, hours_end=hours_end, sources=sources_filter)
+    
+    # Detect signals within the same window; articles were already source-filtered
+    # by the query, so the signals need no post-filter
+    risks = detector.detect_risks(articles=articles)
+    opportunities = detector.detect_opportunities(articles=articles)
+    
+    # Group by source for per-source analysis (single pass, order preserved)
+    risks_by_source = defaultdict(list)
+    opportunities_by_source = defaultdict(list)
+    
+    for risk in risks:
+        risks_by_source[risk.get('source', 'Unknown')].append(risk)
+    
+    for opp in opportunities:
+        opportunities_by_source[opp.get('source', 'Unknown')].append(opp)
+    
+    # Distributions come from the same fetched window; trending is counted in SQLite
+    # from the tokens stored when articles were processed
+    cat_dist = dict(sorted(Counter(a.category for a in articles if a.category is not None).items()))
+    source_dist = dict(sorted(Counter(a.source for a in articles).items()))
+    trending = processor.get_trending_topics(hours_start=hours_start, hours_end=hours_end, sources=sources_filter)
+    # One columnar view of the window, shared by the Deep Analysis and per-source tabs
+    columns = processor.to_columns(articles)
+    
+    return articles, risks, opportunities, dict(risks_by_source), dict(opportunities_by_source), cat_dist, source_dist, trending, columns
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False, max_entries=32)
+def get_timeline_rows(hours_start, hours_end, selected_sources_tuple, window_digest=None):
+    """Hourly per-category counts for the Activity Timeline, memoised on the same window digest"""
+    return db.get_hourly_category_counts(hours=hours_start, hours_end=hours_end, sources=list(selected_sources_tuple) or None)
+
+
+# Sidebar - static chrome is grouped with its neighbours so each section is sent
+# as one markdown element rather than one per separator/header
+st.sidebar.markdown(_SIDEBAR_BANNER_HTML, unsafe_allow_html=True)
 
 # News source filter
-st.sidebar.markdown('<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 3px 12px rgba(0,0,0,0.9), 0 1px 4px rgba(102, 126, 234, 0.6); letter-spacing: 0.3px;">News Sources</p>', unsafe_allow_html=True)
 
-# Get ENABLED sources from config (only show business-focused sources)
-enabled_sources = [config['name'] for key, config in NEWS_SOURCES.items() if config.get('enabled', False)]
+@st.cache_data(ttl=300, show_spinner=False)
+def _enabled_sources():
+    """ENABLED sources from config (only show business-focused sources)"""
+    return sorted(config['name'] for config in NEWS_SOURCES.values() if config.get('enabled', False))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _db_sources(_db):
+    """Any other sources seen in the database"""
+    return list(_db.list_sources())
+
 
-# Also get any other sources from database 
-db_sources = list(set([src for src in db.get_source_distribution(24*365).keys()]))
-all_db_sources = sorted(list(set(enabled_sources + db_sources)))
+@st.cache_data(ttl=300, show_spinner=False)
+def _all_sources(_db):
+    """Sorted, de-duplicated union of enabled and database sources"""
+    return tuple(sorted(set(_enabled_sources()).union(_db_sources(_db))))
+
+
+enabled_sources = _enabled_sources()
+all_db_sources = _all_sources(db)
 
 # Initialize session state - default to ONLY enabled sources
 if 'selected_sources' not in st.session_state:
-    st.session_state.selected_sources = sorted(enabled_sources)
+    st.session_state.selected_sources = list(enabled_sources)
 
 # Multi-select for sources
 selected_sources = st.sidebar.multiselect(
     "Choose sources to display:",
-    options=sorted(all_db_sources),
+    options=all_db_sources,
     default=st.session_state.selected_sources,
     key='source_selector',
     label_visibility="visible"
 )
 
-# Update session state
-st.session_state.selected_sources = selected_sources
+# Update session state only when the selection actually changed
+if frozenset(selected_sources) != frozenset(st.session_state.selected_sources):
+    st.session_state.selected_sources = selected_sources
 
 # If nothing selected, show all
 if not selected_sources:
-    selected_sources = sorted(all_db_sources)
-
-# Show count
-st.sidebar.markdown(f'<p style="color: white; font-size: 13px; margin-top: 8px; font-weight: 700; text-shadow: 0 2px 6px rgba(0,0,0,0.8); background: rgba(102, 126, 234, 0.15); padding: 8px 12px; border-radius: 8px; border: 1px solid rgba(102, 126, 234, 0.3);">{len(selected_sources)} of {len(all_db_sources)} sources selected</p>', unsafe_allow_html=True)
+    selected_sources = list(all_db_sources)
 
-st.sidebar.markdown('<div style="margin: 8px 0; border-top: 1px solid rgba(255,255,255,0.2);"></div>', unsafe_allow_html=True)
-
-# Time range selector
-st.sidebar.markdown('<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 2px 8px rgba(0,0,0,0.6), 0 1px 3px rgba(102, 126, 234, 0.4); letter-spacing: 0.3px;">Time Window</p>', unsafe_allow_html=True)
-time_range = st.sidebar.selectbox(
+# Show count, then the time range selector header
+st.sidebar.markdown(
+    f'<p style="color: white; font-size: 13px; margin-top: 8px; font-weight: 700; text-shadow: 0 2px 6px rgba(0,0,0,0.8); background: rgba(102, 126, 234, 0.15); padding: 8px 12px; border-radius: 8px; border: 1px solid rgba(102, 126, 234, 0.3);">{len(selected_sources)} of {len(all_db_sources)} sources selected</p>'
+    + _SIDEBAR_THIN_SEP
+    + _SIDEBAR_HDR_TMPL.format("Time Window"),
+    unsafe_allow_html=True
+)
+time_idx = st.sidebar.selectbox(
     "Time Window",
-    [
-        "Live – Last 6 Hours",
-        "Live – Last 12 Hours",
-        "Live – Last 24 Hours",
-        "Recent – Last 48 Hours",
-        "Recent – Last 72 Hours",
-        "Week – Last 7 Days",
-        "Biweekly – Last 14 Days",
-        "Monthly – Last 30 Days",
-    ],
+    range(len(_TIME_LABELS)),
     index=5,
+    format_func=_TIME_LABELS.__getitem__,
     label_visibility="collapsed",
 )
+time_range = _TIME_LABELS[time_idx]
+hours_start, hours_end = _TIME_WINDOWS[time_idx]
 
-# Professional, non-overlapping windows (older bound, newer bound)
-time_map = {
-    "Live – Last 6 Hours": (6, 0),
-    "Live – Last 12 Hours": (12, 0),
-    "Live – Last 24 Hours": (24, 0),
-    "Recent – Last 48 Hours": (48, 0),
-    "Recent – Last 72 Hours": (72, 0),
-    "Week – Last 7 Days": (168, 0),
-    "Biweekly – Last 14 Days": (336, 0),
-    "Monthly – Last 30 Days": (720, 0),
-}
-hours_start, hours_end = time_map[time_range]
-
-st.sidebar.markdown('<div style="margin: 10px 0; border-top: 2px solid rgba(102, 126, 234, 0.4); box-shadow: 0 1px 8px rgba(102, 126, 234, 0.3);"></div>', unsafe_allow_html=True)
+st.sidebar.markdown(_SIDEBAR_SEP, unsafe_allow_html=True)
 
 # Refresh button
 if st.sidebar.button("Refresh Data", type="primary", key="refresh_btn"):
@@ -759,130 +287,152 @@ if st.sidebar.button("Retrain ML Model", type="primary", key="retrain_btn"):
     st.session_state.retrain_ml = True
 
 # Show ML Model Status
-try:
-    ml_info = processor.get_ml_info() if hasattr(processor, 'get_ml_info') else {'ml_available': False}
-except Exception:
-    ml_info = {'ml_available': False}
-    
+@st.cache_data(ttl=60, show_spinner=False)
+def _ml_info(_processor):
+    """ML model status for the sidebar card; cleared when the model is retrained"""
+    try:
+        return _processor.get_ml_info()
+    except Exception:
+        return {'ml_available': False}
+
+
+# Card markup is fixed; only status, colour and accuracy vary per run
+_ML_CARD_TMPL = """
+    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.06) 100%); backdrop-filter: blur(16px); padding: 12px; border-radius: 10px; margin-top: 10px; border: 1px solid rgba(255, 255, 255, 0.2);">
+        <p style="color: rgba(255, 255, 255, 0.95); font-size: 13px; margin: 0; font-weight: 500;">
+            <strong>ML Model:</strong> <span style="color: {color}; font-weight: bold;">{status}</span><br/>
+            <strong>Accuracy:</strong> {accuracy:.1f}%
+        </p>
+    </div>
+"""
+_ML_FALLBACK_CARD = """
+    <div style="background: linear-gradient(135deg, rgba(255, 200, 100, 0.15) 0%, rgba(255, 150, 50, 0.1) 100%); backdrop-filter: blur(16px); padding: 12px; border-radius: 10px; margin-top: 10px; border: 1px solid rgba(255, 200, 100, 0.3);">
+        <p style="color: rgba(255, 255, 255, 0.9); font-size: 13px; margin: 0; font-weight: 500;">
+            ML: Using keyword fallback
+        </p>
+    </div>
+"""
+
+ml_info = _ml_info(processor)
+
 if ml_info.get('ml_available', False):
-    ml_status = "Trained" if ml_info.get('is_trained') else "Not Trained"
-    ml_accuracy = ml_info.get('accuracy', 0) * 100
-    status_color = "#10b981" if ml_info.get('is_trained') else "#f59e0b"
-    st.sidebar.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.06) 100%); backdrop-filter: blur(16px); padding: 12px; border-radius: 10px; margin-top: 10px; border: 1px solid rgba(255, 255, 255, 0.2);">
-            <p style="color: rgba(255, 255, 255, 0.95); font-size: 13px; margin: 0; font-weight: 500;">
-                <strong>ML Model:</strong> <span style="color: {status_color}; font-weight: bold;">{ml_status}</span><br/>
-                <strong>Accuracy:</strong> {ml_accuracy:.1f}%
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    is_trained = bool(ml_info.get('is_trained'))
+    ml_card = _ML_CARD_TMPL.format(
+        status="Trained" if is_trained else "Not Trained",
+        color="#10b981" if is_trained else "#f59e0b",
+        accuracy=ml_info.get('accuracy', 0) * 100,
+    )
 else:
-    st.sidebar.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(255, 200, 100, 0.15) 0%, rgba(255, 150, 50, 0.1) 100%); backdrop-filter: blur(16px); padding: 12px; border-radius: 10px; margin-top: 10px; border: 1px solid rgba(255, 200, 100, 0.3);">
-            <p style="color: rgba(255, 255, 255, 0.9); font-size: 13px; margin: 0; font-weight: 500;">
-                ML: Using keyword fallback
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    ml_card = _ML_FALLBACK_CARD
 
-st.sidebar.markdown('<div style="margin: 10px 0; border-top: 2px solid rgba(102, 126, 234, 0.4); box-shadow: 0 1px 8px rgba(102, 126, 234, 0.3);"></div>', unsafe_allow_html=True)
+# ML card, separator and the auto-refresh section header in one element
+st.sidebar.markdown(ml_card + _SIDEBAR_SEP + _SIDEBAR_HDR_TMPL.format("Real-Time Updates"), unsafe_allow_html=True)
 
 # Auto-refresh toggle with interval selection and auto-collection
-st.sidebar.markdown('<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 2px 8px rgba(0,0,0,0.6), 0 1px 3px rgba(102, 126, 234, 0.4); letter-spacing: 0.3px;">Real-Time Updates</p>', unsafe_allow_html=True)
 
 auto_refresh = st.sidebar.checkbox("Enable Auto-refresh", value=False, key="auto_refresh")
 auto_collect = st.sidebar.checkbox("Auto-collect new articles", value=False, disabled=not auto_refresh, key="auto_collect", help="Automatically scrape new articles on each refresh")
 refresh_interval = st.sidebar.selectbox(
     "Refresh Interval",
-    options=["1 minute", "5 minutes", "15 minutes", "30 minutes", "1 hour"],
+    options=list(INTERVAL_MS),
     index=1,  # Default to 5 minutes
     disabled=not auto_refresh,
     key="refresh_interval"
 )
 
 # Convert to milliseconds for st_autorefresh
-interval_ms = {
-    "1 minute": 60000, 
-    "5 minutes": 300000, 
-    "15 minutes": 900000,
-    "30 minutes": 1800000,
-    "1 hour": 3600000
-}.get(refresh_interval, 300000)
+interval_ms = INTERVAL_MS.get(refresh_interval, 300000)
 
 # Display last updated time and handle auto-collection
-last_update_time = datetime.now().strftime('%H:%M:%S')
+last_update_time = now_str[-8:]  # HH:MM:SS part of the per-run timestamp
 
 # Track last collection time in session state
 if 'last_collection_time' not in st.session_state:
     st.session_state.last_collection_time = None
 if 'collection_count' not in st.session_state:
     st.session_state.collection_count = 0
+if 'next_collect_at' not in st.session_state:
+    st.session_state.next_collect_at = 0.0  # time.monotonic() deadline; 0 collects on first enable
+
+# Only Live windows poll; historical views barely change between refreshes.
+# Auto-collect keeps the timer running on any window: collection is driven (and
+# the background scrape polled) by these reruns
+live_window = time_range.startswith("Live")
+refresh_timer = live_window or auto_collect
 
 if auto_refresh:
     # Apply auto-refresh
-    refresh_count = st_autorefresh(interval=interval_ms, limit=None, key="data_refresh")
+    if refresh_timer:
+        from streamlit_autorefresh import st_autorefresh
+        refresh_count = st_autorefresh(interval=interval_ms, limit=None, debounce=True, key="data_refresh")
     
     # Auto-collect if enabled and enough time has passed
     if auto_collect:
-        should_collect = False
-        if st.session_state.last_collection_time is None:
-            should_collect = True
-        else:
-            time_since_last = (datetime.now() - st.session_state.last_collection_time).total_seconds()
-            # Only collect if at least the refresh interval has passed
-            if time_since_last >= (interval_ms / 1000) - 10:  # 10 second buffer
-                should_collect = True
+        should_collect = time.monotonic() >= st.session_state.next_collect_at
         
-        if should_collect:
-            # Run background collection
-            with st.spinner("Collecting new articles..."):
-                try:
-                    scraper = NewsScraper()
-                    new_articles = scraper.scrape_all()
-                    scraper.close()
-                    
-                    # Process the new articles
-                    db_collect = DatabaseManager()
-                    proc_collect = DataProcessor(db=db_collect)
-                    processed = proc_collect.process_articles()
-                    db_collect.close()
-                    
-                    st.session_state.last_collection_time = datetime.now()
-                    st.session_state.collection_count += 1
-                    st.cache_data.clear()  # Clear cache to show new data
-                except Exception as e:
-                    st.sidebar.warning(f"Collection error: {str(e)[:50]}")
+        # Scraping runs in the background; each rerun polls the future and only
+        # finishes the cycle (processing, cache clear) once it is done
+        scrape_future = st.session_state.get('scrape_future')
+        if scrape_future is not None and scrape_future.done():
+            st.session_state.scrape_future = None
+            try:
+                new_articles = scrape_future.result()
+                
+                # Process the new articles with the shared processor
+                processed = processor.process_articles()
+                
+                st.session_state.last_collection_time = datetime.now()
+                st.session_state.collection_count += 1
+                get_dashboard_data.clear()  # Drop memoised dashboard data to show new articles
+            except Exception as e:
+                st.sidebar.warning(f"Collection error: {str(e)[:50]}")
+        elif scrape_future is None and should_collect:
+            st.session_state.scrape_future = get_collection_executor().submit(_run_scrape)
+            # One interval from now (10 second buffer for tick jitter); ticks missed
+            # while the tab was hidden are skipped rather than caught up
+            st.session_state.next_collect_at = time.monotonic() + interval_ms / 1000 - 10
+        
+        if st.session_state.get('scrape_future') is not None:
+            st.sidebar.status("Collecting new articles...", state="running", expanded=False)
     
     # Show live status
     collect_status = ""
     if auto_collect and st.session_state.last_collection_time:
         collect_status = f"<br/><span style='font-size: 11px;'>Collections: {st.session_state.collection_count} | Last: {st.session_state.last_collection_time.strftime('%H:%M:%S')}</span>"
     
-    st.sidebar.markdown(f"""
+    if live_window:
+        live_label = f"LIVE - Refreshing every {refresh_interval}"
+    elif auto_collect:
+        live_label = f"COLLECTING - Every {refresh_interval} (select a Live window to follow it)"
+    else:
+        live_label = "PAUSED - Select a Live window to auto-refresh"
+    refresh_status_html = f"""
         <div style="background: linear-gradient(135deg, rgba(0, 255, 100, 0.15) 0%, rgba(0, 200, 80, 0.1) 100%); padding: 10px 14px; border-radius: 8px; border: 1px solid rgba(0, 255, 100, 0.3); margin-top: 10px;">
             <p style="color: #00ff88; font-size: 13px; margin: 0; font-weight: 600;">
-                <span style="display: inline-block; width: 8px; height: 8px; background: #22c55e; border-radius: 50%; margin-right: 6px; animation: pulse 2s infinite;"></span>LIVE - Refreshing every {refresh_interval}<br/>
-                <span style="font-size: 11px; opacity: 0.85;">Last updated: {last_update_time}</span>
-                {collect_status}
+                <span style="display: inline-block; width: 8px; height: 8px; background: #22c55e; border-radius: 50%; margin-right: 6px; animation: pulse 2s infinite;"></span>{live_label}<br/>
+                <span style="font-size: 11px; opacity: 0.85;">Last updated: {last_update_time}</span>{collect_status}
             </p>
         </div>
-    """, unsafe_allow_html=True)
+    """
 else:
-    st.sidebar.markdown(f"""
+    refresh_status_html = f"""
         <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.08) 0%, rgba(255, 255, 255, 0.04) 100%); padding: 10px 14px; border-radius: 8px; border: 1px solid rgba(255, 255, 255, 0.15); margin-top: 10px;">
             <p style="color: rgba(255, 255, 255, 0.7); font-size: 13px; margin: 0; font-weight: 500;">
                 Auto-refresh disabled<br/>
                 <span style="font-size: 11px; opacity: 0.85;">Last loaded: {last_update_time}</span>
             </p>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+# Refresh status, current data stats and About go out as one element
+@st.cache_data(ttl=60, show_spinner=False)
+def _total_articles(_db):
+    """Headline article count; a minute stale is fine for the sidebar"""
+    return _db.get_total_articles()
 
-st.sidebar.markdown('<div style="margin: 10px 0; border-top: 2px solid rgba(102, 126, 234, 0.4); box-shadow: 0 1px 8px rgba(102, 126, 234, 0.3);"></div>', unsafe_allow_html=True)
 
-# Show current data stats
-st.sidebar.markdown('<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 2px 8px rgba(0,0,0,0.6), 0 1px 3px rgba(102, 126, 234, 0.4); letter-spacing: 0.3px;">Quick Stats</p>', unsafe_allow_html=True)
-total_articles_db = db.get_total_articles()
-st.sidebar.markdown(f"""
+total_articles_db = _total_articles(db)
+quick_stats_html = f"""
     <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%); backdrop-filter: blur(20px) saturate(160%); -webkit-backdrop-filter: blur(20px) saturate(160%); padding: 18px; border-radius: 12px; margin-bottom: 14px; border: 1.5px solid rgba(255, 255, 255, 0.25); box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), 0 0 20px rgba(102, 126, 234, 0.2), inset 0 1px 0 rgba(255, 255, 255, 0.2);">
         <p style="color: rgba(255, 255, 255, 0.96); font-size: 15px; margin: 0; font-weight: 600; line-height: 1.8; text-shadow: 0 1px 4px rgba(0,0,0,0.4);">
             <strong style="font-weight: 700;">Total in DB:</strong> <span style="color: #4facfe; font-weight: 700; text-shadow: 0 0 10px rgba(79, 172, 254, 0.5);">{total_articles_db}</span><br/>
@@ -890,16 +440,12 @@ st.sidebar.markdown(f"""
             <strong style="font-weight: 700;">Sources:</strong> <span style="color: #00f2fe; font-weight: 700; text-shadow: 0 0 10px rgba(0, 242, 254, 0.5);">{len(selected_sources)}</span>
         </p>
     </div>
-""", unsafe_allow_html=True)
-
-st.sidebar.markdown('<div style="margin: 10px 0; border-top: 2px solid rgba(102, 126, 234, 0.4); box-shadow: 0 1px 8px rgba(102, 126, 234, 0.3);"></div>', unsafe_allow_html=True)
-
-st.sidebar.markdown('<p style="color: white; font-weight: 900; font-size: 18px; margin-bottom: 14px; text-shadow: 0 2px 8px rgba(0,0,0,0.6), 0 1px 3px rgba(102, 126, 234, 0.4); letter-spacing: 0.3px;">About</p>', unsafe_allow_html=True)
-st.sidebar.markdown("""
-    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.15) 0%, rgba(255, 255, 255, 0.08) 100%); backdrop-filter: blur(20px) saturate(160%); -webkit-backdrop-filter: blur(20px) saturate(160%); padding: 18px; border-radius: 12px; color: rgba(255, 255, 255, 0.96); font-size: 15px; line-height: 1.7; border: 1.5px solid rgba(255, 255, 255, 0.25); box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), 0 0 20px rgba(102, 126, 234, 0.2), inset 0 1px 0 rgba(255, 255, 255, 0.2); font-weight: 600; text-shadow: 0 1px 4px rgba(0,0,0,0.4);">
-        Real-time situational awareness platform providing actionable intelligence for Sri Lankan businesses through advanced data analytics.
-    </div>
-""", unsafe_allow_html=True)
+"""
+st.sidebar.markdown("".join((
+    refresh_status_html,
+    _SIDEBAR_SEP, _SIDEBAR_HDR_TMPL.format("Quick Stats"), quick_stats_html,
+    _SIDEBAR_SEP, _SIDEBAR_HDR_TMPL.format("About"), _ABOUT_HTML,
+)), unsafe_allow_html=True)
 
 # Main content
 st.markdown("""
@@ -911,7 +457,7 @@ st.markdown("""
 
 # Data Collection Panel - Shows when "Run Collection" is clicked
 if st.session_state.get('run_collection', False):
-    st.markdown('<div class="section-header">Data Collection Console</div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_HDR_TMPL.format("Data Collection Console"), unsafe_allow_html=True)
     
     with st.container():
         collection_placeholder = st.empty()
@@ -926,22 +472,28 @@ if st.session_state.get('run_collection', False):
                         <span style="color: #93c5fd;">║</span>   <strong style="color: #ffffff;">Sri Lanka Business Intelligence Platform</strong>               <span style="color: #93c5fd;">║</span><br/>
                         <span style="color: #93c5fd;">║</span>   Real-Time Situational Awareness System                 <span style="color: #93c5fd;">║</span><br/>
                         <span style="color: #93c5fd;">╚═══════════════════════════════════════════════════════════╝</span><br/><br/>
-                        <span style="color: #fbbf24;">Starting collection cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</span>
+                        <span style="color: #fbbf24;">Starting collection cycle at {now_str}</span>
                     </p>
                 </div>
             """, unsafe_allow_html=True)
             
             # Step 1: Scrape
             with st.spinner("[1/3] Scraping news sources..."):
-                scraper = NewsScraper()
-                scraped_articles = scraper.scrape_all()
-                scraper.close()
+                # _run_scrape closes the scraper's HTTP session and engine even on failure
+                try:
+                    scraped_articles = _run_scrape()
+                except Exception as e:
+                    # e.g. the database is locked by another writer; already-stored
+                    # articles are still processed below
+                    scraped_articles = None
+                    st.error(f"Collection error: {str(e)[:200]}")
             
-            st.success(f"✓ Scraped {len(scraped_articles)} articles")
+            if scraped_articles is not None:
+                st.success(f"✓ Scraped {len(scraped_articles)} articles")
             
             # Show per-source breakdown
             source_counts = {}
-            for art in scraped_articles:
+            for art in scraped_articles or []:
                 src = art.get('source', 'Unknown')
                 source_counts[src] = source_counts.get(src, 0) + 1
             
@@ -953,14 +505,12 @@ if st.session_state.get('run_collection', False):
             
             # Step 2: Process
             with st.spinner("[2/3] Processing and categorizing articles..."):
-                db_coll = DatabaseManager()
-                proc_coll = DataProcessor(db=db_coll)
-                processed = proc_coll.process_articles()
+                processed = processor.process_articles()
             
             st.success(f"✓ Processed {len(processed)} new articles")
             
             # Category distribution
-            cat_dist_coll = proc_coll.get_category_distribution(hours_start=24, hours_end=0)
+            cat_dist_coll = processor.get_category_distribution(hours_start=24, hours_end=0)
             if cat_dist_coll:
                 st.markdown("**Category Distribution (Last 24h):**")
                 cat_cols = st.columns(min(len(cat_dist_coll), 5))
@@ -970,11 +520,10 @@ if st.session_state.get('run_collection', False):
             
             # Step 3: Signals
             with st.spinner("[3/3] Detecting signals..."):
-                det_coll = SignalDetector(db=db_coll, processor=proc_coll)
-                signals_coll = det_coll.generate_all_signals()
-                det_coll.close()
+                signals_coll = detector.generate_all_signals()
             
             st.success("✓ Signal detection complete")
+            get_dashboard_data.clear()  # New articles were stored; don't serve the memoised view
             
             # Signal Summary
             st.markdown("---")
@@ -994,9 +543,9 @@ if st.session_state.get('run_collection', False):
             if signals_coll['risks']:
                 st.markdown("**Top Risks:**")
                 for risk in signals_coll['risks'][:3]:
-                    severity = risk.get('severity', 'low').upper()
-                    color = "#ef4444" if severity == "HIGH" else "#f59e0b" if severity == "MEDIUM" else "#22c55e"
-                    st.markdown(f"<span style='color: {color}; font-weight: bold;'>[{severity}]</span> {risk.get('description', '')[:100]}...", unsafe_allow_html=True)
+                    severity = risk.get('severity', 'low')
+                    color = SEVERITY_COLOR.get(severity, SEVERITY_COLOR['low'])
+                    st.markdown(f"<span style='color: {color}; font-weight: bold;'>[{severity.upper()}]</span> {risk.get('description', '')[:100]}...", unsafe_allow_html=True)
             
             # Top Opportunities
             if signals_coll['opportunities']:
@@ -1032,7 +581,7 @@ if st.session_state.get('run_collection', False):
 
 # ML Model Retrain Panel - Shows when "Retrain ML Model" is clicked
 if st.session_state.get('retrain_ml', False):
-    st.markdown('<div class="section-header">ML Model Training Console</div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_HDR_TMPL.format("ML Model Training Console"), unsafe_allow_html=True)
     
     with st.container():
         st.markdown(f"""
@@ -1044,13 +593,14 @@ if st.session_state.get('retrain_ml', False):
                     <span style="color: #c4b5fd;">║</span>   <strong style="color: #ffffff;">Machine Learning Model Training</strong>                        <span style="color: #c4b5fd;">║</span><br/>
                     <span style="color: #c4b5fd;">║</span>   TF-IDF + Naive Bayes Classifier                        <span style="color: #c4b5fd;">║</span><br/>
                     <span style="color: #c4b5fd;">╚═══════════════════════════════════════════════════════════╝</span><br/><br/>
-                    <span style="color: #fbbf24;">Starting training at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</span>
+                    <span style="color: #fbbf24;">Starting training at {now_str}</span>
                 </p>
             </div>
         """, unsafe_allow_html=True)
         
         with st.spinner("Training ML model with current database articles..."):
             result = processor.retrain_ml_model()
+        _ml_info.clear()
         
         if result.get('success', False):
             st.success(f"Model trained successfully!")
@@ -1087,59 +637,14 @@ if st.session_state.get('retrain_ml', False):
     
     st.markdown("---")
 
-# Get data - Real-time data retrieval (no caching for accuracy)
-def get_dashboard_data(hours_start, hours_end, selected_sources_tuple):
-    # Convert tuple back to list for filtering
-    selected_sources = list(selected_sources_tuple) if selected_sources_tuple else []
-    # Pass sources to database for accurate filtering at DB level
-    sources_filter = selected_sources if selected_sources else None
-    
-    # Need to create new DB instance since cached function can't use cached resources
-    db_temp = DatabaseManager()
-    processor_temp = DataProcessor(db=db_temp)
-    # Process any newly scraped but unprocessed articles so categories/sentiments exist
-    processor_temp.process_articles()
-    
-    # Use week-based range query for high accuracy
-    articles = db_temp.get_recent_articles(hours=hours_start, hours_end=hours_end, sources=sources_filter)
-    
-    # Detect signals per source within the same window
-    detector_temp = SignalDetector(db=db_temp, processor=processor_temp)
-    all_risks = detector_temp.detect_risks(hours_start=hours_start, hours_end=hours_end, sources=sources_filter)
-    all_opportunities = detector_temp.detect_opportunities(hours_start=hours_start, hours_end=hours_end, sources=sources_filter)
-    
-    # Filter risks and opportunities by selected sources
-    if sources_filter:
-        risks = [r for r in all_risks if r.get('source') in sources_filter]
-        opportunities = [o for o in all_opportunities if o.get('source') in sources_filter]
-    else:
-        risks = all_risks
-        opportunities = all_opportunities
-    
-    # Group by source for per-source analysis
-    risks_by_source = {}
-    opportunities_by_source = {}
-    
-    for risk in risks:
-        source = risk.get('source', 'Unknown')
-        if source not in risks_by_source:
-            risks_by_source[source] = []
-        risks_by_source[source].append(risk)
-    
-    for opp in opportunities:
-        source = opp.get('source', 'Unknown')
-        if source not in opportunities_by_source:
-            opportunities_by_source[source] = []
-        opportunities_by_source[source].append(opp)
-    
-    # Get distributions with week-based range for accuracy
-    cat_dist = db_temp.get_category_distribution(hours=hours_start, hours_end=hours_end, sources=sources_filter)
-    source_dist = db_temp.get_source_distribution(hours=hours_start, hours_end=hours_end, sources=sources_filter)
-    
-    # Get trending topics for the week
-    trending = processor_temp.get_trending_topics(hours_start=hours_start, hours_end=hours_end, sources=sources_filter)
-    
-    return articles, risks, opportunities, risks_by_source, opportunities_by_source, cat_dist, source_dist, trending
+# Reads are pure SELECTs; categorising happens at collection time. This guard only
+# catches rows stored by a writer that did not process them, so bursts of widget
+# reruns share one COUNT per UNPROCESSED_CHECK_SECONDS instead of one per run.
+if time.monotonic() >= st.session_state.get('next_unprocessed_check', 0.0):
+    st.session_state.next_unprocessed_check = time.monotonic() + UNPROCESSED_CHECK_SECONDS
+    if db.count_unprocessed():
+        processor.process_articles()
+        get_dashboard_data.clear()
 
 # Initialize articles with empty list as fallback, then populate from function
 articles = []
@@ -1151,13 +656,16 @@ cat_dist = {}
 source_dist = {}
 trending = []
 
-articles, risks, opportunities, risks_by_source, opportunities_by_source, cat_dist, source_dist, trending = get_dashboard_data(hours_start, hours_end, tuple(selected_sources))
+window_digest = db.get_window_digest(hours=hours_start, hours_end=hours_end, sources=selected_sources or None)
+articles, risks, opportunities, risks_by_source, opportunities_by_source, cat_dist, source_dist, trending, columns = get_dashboard_data(
+    hours_start, hours_end, tuple(selected_sources), window_digest,
+)
 
 if not articles:
     st.info(f"No articles found in {time_range}. Try widening the window (e.g., Week – Last 7 Days).")
 
 # Key Metrics with enhanced styling
-st.markdown('<div class="section-header">Key Performance Indicators</div>', unsafe_allow_html=True)
+st.markdown(_SECTION_HDR_TMPL.format("Key Performance Indicators"), unsafe_allow_html=True)
 
 col1, col2, col3, col4 = st.columns(4)
 
@@ -1196,180 +704,318 @@ with col4:
 
 st.markdown("---")
 
-# Two column layout
-col_left, col_right = st.columns([2, 1])
+# Chart builders - cached on the plotted data itself, so a rerun with the same
+# sources/window (or a tab switch) reuses the figure instead of rebuilding it.
+# Held as shared objects (cache_resource) rather than pickled copies: a cache hit
+# then skips unpickling and re-validating the figure. Callers treat them as read-only.
+@st.cache_resource(ttl=300, show_spinner=False, max_entries=64)
+def build_category_figure(cat_items, window_label):
+    # Category distribution chart
+    df_cat = pd.DataFrame(list(cat_items), columns=['Category', 'Count'])
+    df_cat = df_cat.sort_values('Count', ascending=False)
+    
+    px, _ = _plotly()
+    fig_cat = px.bar(
+        df_cat,
+        x='Category',
+        y='Count',
+        title=f'News Coverage by Category ({window_label})',
+        color='Count',
+        color_continuous_scale=['#0891b2', '#2563eb', '#1a365d']
+    )
+    fig_cat.update_layout(
+        showlegend=False,
+        height=550,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Inter, sans-serif", size=13, color='white'),
+        title_font_size=18,
+        title_font_color='white',
+        title_font_weight=700
+    )
+    fig_cat.update_traces(marker_line_color='rgba(255,255,255,0.4)', marker_line_width=2)
+    fig_cat.update_xaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
+    fig_cat.update_yaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
+    return fig_cat
 
-with col_left:
-    # National Activity Indicators
-    st.markdown('<div class="section-header">National Activity Indicators</div>', unsafe_allow_html=True)
-    
-    if cat_dist:
-        # Category distribution chart
-        df_cat = pd.DataFrame(list(cat_dist.items()), columns=['Category', 'Count'])
-        df_cat = df_cat.sort_values('Count', ascending=False)
-        
-        fig_cat = px.bar(
-            df_cat,
-            x='Category',
-            y='Count',
-            title=f'News Coverage by Category ({time_range.split("(")[0].strip()})',
-            color='Count',
-            color_continuous_scale=['#0891b2', '#2563eb', '#1a365d']
+
+@st.cache_resource(ttl=300, show_spinner=False, max_entries=64)
+def build_trending_figure(trending_items):
+    # Create trending topics visualization
+    trending_words = [t[0] for t in trending_items]
+    trending_counts = [t[1] for t in trending_items]
+    
+    df_trending = pd.DataFrame({
+        'Topic': trending_words,
+        'Mentions': trending_counts
+    })
+    
+    px, _ = _plotly()
+    fig_trend = px.bar(
+        df_trending,
+        x='Mentions',
+        y='Topic',
+        orientation='h',
+        title='Most Mentioned Topics',
+        color='Mentions',
+        color_continuous_scale=['#059669', '#0891b2', '#2563eb']
+    )
+    fig_trend.update_layout(
+        showlegend=False,
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Inter, sans-serif", size=13, color='white'),
+        title_font_size=18,
+        title_font_color='white',
+        title_font_weight=700
+    )
+    fig_trend.update_traces(marker_line_color='rgba(255,255,255,0.4)', marker_line_width=2)
+    fig_trend.update_xaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
+    fig_trend.update_yaxes(tickfont=dict(size=12, color='white'))
+    return fig_trend
+
+
+@st.cache_resource(ttl=300, show_spinner=False, max_entries=64)
+def build_source_figure(source_items):
+    df_source = pd.DataFrame(list(source_items), columns=['Source', 'Articles'])
+    
+    px, _ = _plotly()
+    fig_source = px.pie(
+        df_source,
+        values='Articles',
+        names='Source',
+        title='Article Distribution by Source',
+        color_discrete_sequence=['#2563eb', '#0891b2', '#059669', '#1a365d', '#7c3aed', '#0284c7', '#4f46e5', '#0d9488', '#2dd4bf'],
+        hole=0.4
+    )
+    fig_source.update_layout(
+        height=550,
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Inter, sans-serif", size=12, color='white'),
+        title_font_size=18,
+        title_font_color='white',
+        title_font_weight=700,
+        legend=dict(font=dict(color='white'))
+    )
+    fig_source.update_traces(textposition='inside', textinfo='percent+label', textfont_size=12, textfont=dict(color='white', family='Inter', weight=700), marker=dict(line=dict(color='rgba(255,255,255,0.3)', width=2)))
+    return fig_source
+
+
+def timeline_frame(timeline_rows):
+    # Hour/category buckets are already aggregated by the database
+    timeline_counts = pd.DataFrame(timeline_rows, columns=['hour', 'category', 'count'])
+    # SQLite emits one fixed bucket format - skip per-call format inference
+    timeline_counts['hour'] = pd.to_datetime(timeline_counts['hour'], format='%Y-%m-%d %H:%M:%S')
+    return timeline_counts
+
+
+@st.cache_resource(ttl=300, show_spinner=False, max_entries=64)
+def build_timeline_figure(timeline_rows):
+    timeline_counts = timeline_frame(timeline_rows)
+    if len(timeline_counts) > TIMELINE_MAX_POINTS:
+        # Long windows: coarser 6-hour buckets keep the plotted point count bounded
+        timeline_counts = (
+            timeline_counts.assign(hour=timeline_counts['hour'].dt.floor('6h'))
+            .groupby(['hour', 'category'], as_index=False)['count'].sum()
         )
-        fig_cat.update_layout(
-            showlegend=False,
-            height=550,
+    
+    # One WebGL (canvas) trace per category instead of SVG paths, in first-seen order.
+    # Traces and layout go into a single go.Figure call so Plotly validates once.
+    _, go = _plotly()
+    colors = ['#2563eb', '#0891b2', '#059669', '#1a365d', '#7c3aed', '#dc2626']
+    return go.Figure(
+        data=[
+            go.Scattergl(
+                x=group['hour'].to_numpy(),
+                y=group['count'].to_numpy(),
+                mode='lines',
+                name=category,
+                line=dict(color=colors[i % len(colors)]),
+                hovertemplate='%{y}<extra>' + category + '</extra>',
+            )
+            for i, (category, group) in enumerate(timeline_counts.groupby('category', sort=False))
+        ],
+        layout=dict(
+            title=dict(text='Article Activity Over Time', font=dict(size=18, color='white', weight=700)),
+            xaxis=dict(title='Time', tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(title='Number of Articles', tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)'),
+            height=650,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(family="Inter, sans-serif", size=13, color='white'),
+            hovermode='x unified',
+            legend=dict(title=dict(text='Category'), font=dict(size=12, color='white'), bgcolor='rgba(255,255,255,0.1)', bordercolor='rgba(255,255,255,0.3)', borderwidth=2),
+        ),
+    )
+
+
+def category_sentiment_frame(cat_rows):
+    return pd.DataFrame(list(cat_rows), columns=['Category', 'Avg Sentiment', 'Article Count'])
+
+
+@st.cache_resource(ttl=300, show_spinner=False, max_entries=64)
+def build_sentiment_figure(cat_rows):
+    # Traces take the summary columns directly as numpy arrays (sent as compact
+    # typed arrays); traces and layout go into a single go.Figure call
+    categories, avg_sentiment, article_counts = zip(*cat_rows)
+    categories = list(categories)
+    
+    _, go = _plotly()
+    return go.Figure(
+        data=[
+            go.Bar(
+                x=categories,
+                y=np.array(article_counts, dtype=np.int32),
+                name='Articles',
+                marker=dict(color='rgba(37, 99, 235, 0.8)', line=dict(color='rgba(37, 99, 235, 1)', width=1.5)),
+            ),
+            go.Scatter(
+                x=categories,
+                y=np.array(avg_sentiment, dtype=np.float64),
+                name='Sentiment',
+                yaxis='y2',
+                marker=dict(color='#059669', size=10),
+                line=dict(width=3, color='#059669'),
+            ),
+        ],
+        layout=dict(
+            title=dict(text='Category Analysis: Volume vs Sentiment', font=dict(size=18, color='white', weight=700)),
+            yaxis=dict(title='Article Count', title_font=dict(color='white', size=14, weight=700), tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)'),
+            yaxis2=dict(title='Avg Sentiment', overlaying='y', side='right', title_font=dict(color='white', size=14, weight=700), tickfont=dict(size=12, color='white')),
+            height=650,
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             font=dict(family="Inter, sans-serif", size=13, color='white'),
-            title_font_size=18,
-            title_font_color='white',
-            title_font_weight=700
+            hovermode='x unified',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=12, color='white'), bgcolor='rgba(255,255,255,0.1)', bordercolor='rgba(255,255,255,0.3)', borderwidth=2),
+        ),
+    )
+
+
+# Risk/opportunity cards - each list is rendered as one markdown element
+_RISK_CARD_TMPL = """
+    <div style="background: linear-gradient(135deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 100%);
+                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
+                border-left: 4px solid {color};">
+        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
+            <span style="background: {color}; color: white; padding: 4px 10px; border-radius: 4px;
+                        font-size: 11px; font-weight: 700; text-transform: uppercase;">{severity}</span>
+            <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
+        </div>
+        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
+    </div>
+"""
+_OPPORTUNITY_CARD_TMPL = """
+    <div style="background: linear-gradient(135deg, rgba(79, 172, 254, 0.1) 0%, rgba(0, 242, 254, 0.05) 100%);
+                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
+                border-left: 4px solid #4facfe;">
+        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
+            <span style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; 
+                        padding: 4px 10px; border-radius: 4px; font-size: 11px; font-weight: 700;">OPPORTUNITY</span>
+            <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
+            <span style="color: #10b981; font-size: 12px; margin-left: auto;">Sentiment: {sentiment:.2f}</span>
+        </div>
+        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
+    </div>
+"""
+# Section header indented like the card templates, so a header + cards string still
+# dedents to column 0 in st.markdown (indented HTML after a blank line is a code block)
+_CARD_SECTION_HDR_TMPL = "\n    " + _SECTION_HDR_TMPL + "\n"
+_ALL_CLEAR_HTML = """
+    <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(16, 185, 129, 0.05) 100%);
+                padding: 16px 20px; border-radius: 10px; border-left: 4px solid #10b981;">
+        <div style="display: flex; align-items: center; gap: 8px;">
+            <span style="color: #10b981; font-weight: 700; font-size: 14px;">ALL CLEAR</span>
+        </div>
+        <p style="color: rgba(255,255,255,0.7); margin: 8px 0 0 0; font-size: 13px;">No active risk alerts detected</p>
+    </div>
+"""
+_SCANNING_HTML = """
+    <div style="background: linear-gradient(135deg, rgba(255,255,255,0.06) 0%, rgba(255,255,255,0.02) 100%);
+                padding: 16px 20px; border-radius: 10px; border-left: 4px solid #6b7280;">
+        <div style="display: flex; align-items: center; gap: 8px;">
+            <span style="color: rgba(255,255,255,0.7); font-weight: 600; font-size: 14px;">SCANNING</span>
+        </div>
+        <p style="color: rgba(255,255,255,0.5); margin: 8px 0 0 0; font-size: 13px;">Monitoring for new opportunities</p>
+    </div>
+"""
+
+
+def risk_cards_html(risk_list):
+    """Concatenated risk cards ('' when there are none)"""
+    cards = []
+    for risk in risk_list:
+        severity = risk.get('severity', 'low')
+        cards.append(_RISK_CARD_TMPL.format(
+            color=SEVERITY_COLOR.get(severity, SEVERITY_COLOR['low']),
+            severity=severity,
+            category=risk.get('category', 'General'),
+            description=risk.get('description', 'No description'),
+        ))
+    return "".join(cards)
+
+
+def opportunity_cards_html(opportunity_list):
+    """Concatenated opportunity cards ('' when there are none)"""
+    return "".join(
+        _OPPORTUNITY_CARD_TMPL.format(
+            category=opp.get('category', 'General'),
+            description=opp.get('description', 'No description'),
+            sentiment=opp.get('sentiment', 0),
         )
-        fig_cat.update_traces(marker_line_color='rgba(255,255,255,0.4)', marker_line_width=2)
-        fig_cat.update_xaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
-        fig_cat.update_yaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
+        for opp in opportunity_list
+    )
+
+
+# Two column layout
+col_left, col_right = st.columns([2, 1])
+
+with col_left:
+    # National Activity Indicators
+    st.markdown(_SECTION_HDR_TMPL.format("National Activity Indicators"), unsafe_allow_html=True)
+    
+    if cat_dist and live_window:
+        # Live windows refresh often - native Arrow-backed chart keeps the payload small
+        df_cat = pd.DataFrame(list(cat_dist.items()), columns=['Category', 'Count']).sort_values('Count', ascending=False)
+        st.bar_chart(df_cat, x='Category', y='Count', color='#2563eb', height=550)
+    elif cat_dist:
+        fig_cat = build_category_figure(tuple(cat_dist.items()), time_range.split("(")[0].strip())
         st.plotly_chart(fig_cat, width='stretch')
     else:
         st.info("No data available for the selected time range")
     
     # Trending Topics
-    st.markdown('<div class="section-header">Trending Topics</div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_HDR_TMPL.format("Trending Topics"), unsafe_allow_html=True)
     
-    if trending:
-        # Create trending topics visualization
-        trending_words = [t[0] for t in trending[:10]]
-        trending_counts = [t[1] for t in trending[:10]]
-        
-        df_trending = pd.DataFrame({
-            'Topic': trending_words,
-            'Mentions': trending_counts
-        })
-        
-        fig_trend = px.bar(
-            df_trending,
-            x='Mentions',
-            y='Topic',
-            orientation='h',
-            title='Most Mentioned Topics',
-            color='Mentions',
-            color_continuous_scale=['#059669', '#0891b2', '#2563eb']
-        )
-        fig_trend.update_layout(
-            showlegend=False,
-            height=600,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Inter, sans-serif", size=13, color='white'),
-            title_font_size=18,
-            title_font_color='white',
-            title_font_weight=700
-        )
-        fig_trend.update_traces(marker_line_color='rgba(255,255,255,0.4)', marker_line_width=2)
-        fig_trend.update_xaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
-        fig_trend.update_yaxes(tickfont=dict(size=12, color='white'))
+    if trending and live_window:
+        df_trending = pd.DataFrame(trending[:10], columns=['Topic', 'Mentions'])
+        st.bar_chart(df_trending, x='Topic', y='Mentions', color='#059669', height=600)
+    elif trending:
+        fig_trend = build_trending_figure(tuple(tuple(t) for t in trending[:10]))
         st.plotly_chart(fig_trend, width='stretch')
     else:
         st.info("Analyzing trending topics...")
     
     # Source distribution
     if source_dist:
-        st.markdown('<div class="section-header">Coverage by Source</div>', unsafe_allow_html=True)
-        df_source = pd.DataFrame(list(source_dist.items()), columns=['Source', 'Articles'])
-        
-        fig_source = px.pie(
-            df_source,
-            values='Articles',
-            names='Source',
-            title='Article Distribution by Source',
-            color_discrete_sequence=['#2563eb', '#0891b2', '#059669', '#1a365d', '#7c3aed', '#0284c7', '#4f46e5', '#0d9488', '#2dd4bf'],
-            hole=0.4
-        )
-        fig_source.update_layout(
-            height=550,
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family="Inter, sans-serif", size=12, color='white'),
-            title_font_size=18,
-            title_font_color='white',
-            title_font_weight=700,
-            legend=dict(font=dict(color='white'))
-        )
-        fig_source.update_traces(textposition='inside', textinfo='percent+label', textfont_size=12, textfont=dict(color='white', family='Inter', weight=700), marker=dict(line=dict(color='rgba(255,255,255,0.3)', width=2)))
+        st.markdown(_SECTION_HDR_TMPL.format("Coverage by Source"), unsafe_allow_html=True)
+        fig_source = build_source_figure(tuple(source_dist.items()))
         st.plotly_chart(fig_source, width='stretch')
 
 with col_right:
-    # Risk & Opportunity Insights
-    st.markdown('<div class="section-header">Risk Alerts</div>', unsafe_allow_html=True)
-    
-    if risks:
-        for risk in risks[:5]:
-            severity = risk.get('severity', 'low')
-            severity_color = "#ef4444" if severity == "high" else "#f59e0b" if severity == "medium" else "#10b981"
-            category = risk.get('category', 'General')
-            description = risk.get('description', 'No description')
-            
-            st.markdown(f'''
-                <div style="background: linear-gradient(135deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 100%);
-                            padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
-                            border-left: 4px solid {severity_color};">
-                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-                        <span style="background: {severity_color}; color: white; padding: 4px 10px; border-radius: 4px;
-                                    font-size: 11px; font-weight: 700; text-transform: uppercase;">{severity}</span>
-                        <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
-                    </div>
-                    <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
-                </div>
-            ''', unsafe_allow_html=True)
-    else:
-        st.markdown('''
-            <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(16, 185, 129, 0.05) 100%);
-                        padding: 16px 20px; border-radius: 10px; border-left: 4px solid #10b981;">
-                <div style="display: flex; align-items: center; gap: 8px;">
-                    <span style="color: #10b981; font-weight: 700; font-size: 14px;">ALL CLEAR</span>
-                </div>
-                <p style="color: rgba(255,255,255,0.7); margin: 8px 0 0 0; font-size: 13px;">No active risk alerts detected</p>
-            </div>
-        ''', unsafe_allow_html=True)
+    # Risk & Opportunity Insights - each header is sent with its cards as one element
+    st.markdown(_CARD_SECTION_HDR_TMPL.format("Risk Alerts") + (risk_cards_html(risks[:5]) or _ALL_CLEAR_HTML), unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Opportunities
-    st.markdown('<div class="section-header">Opportunities</div>', unsafe_allow_html=True)
-    
-    if opportunities:
-        for opp in opportunities[:5]:
-            category = opp.get('category', 'General')
-            description = opp.get('description', 'No description')
-            sentiment = opp.get('sentiment', 0)
-            
-            st.markdown(f'''
-                <div style="background: linear-gradient(135deg, rgba(79, 172, 254, 0.1) 0%, rgba(0, 242, 254, 0.05) 100%);
-                            padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
-                            border-left: 4px solid #4facfe;">
-                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-                        <span style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; 
-                                    padding: 4px 10px; border-radius: 4px; font-size: 11px; font-weight: 700;">OPPORTUNITY</span>
-                        <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
-                        <span style="color: #10b981; font-size: 12px; margin-left: auto;">Sentiment: {sentiment:.2f}</span>
-                    </div>
-                    <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
-                </div>
-            ''', unsafe_allow_html=True)
-    else:
-        st.markdown('''
-            <div style="background: linear-gradient(135deg, rgba(255,255,255,0.06) 0%, rgba(255,255,255,0.02) 100%);
-                        padding: 16px 20px; border-radius: 10px; border-left: 4px solid #6b7280;">
-                <div style="display: flex; align-items: center; gap: 8px;">
-                    <span style="color: rgba(255,255,255,0.7); font-weight: 600; font-size: 14px;">SCANNING</span>
-                </div>
-                <p style="color: rgba(255,255,255,0.5); margin: 8px 0 0 0; font-size: 13px;">Monitoring for new opportunities</p>
-            </div>
-        ''', unsafe_allow_html=True)
+    st.markdown(_CARD_SECTION_HDR_TMPL.format("Opportunities") + (opportunity_cards_html(opportunities[:5]) or _SCANNING_HTML), unsafe_allow_html=True)
     
     st.markdown("---")
     
     # System Status
-    st.markdown('<div class="section-header">System Status</div>', unsafe_allow_html=True)
+    st.markdown(_SECTION_HDR_TMPL.format("System Status"), unsafe_allow_html=True)
     
     st.markdown(f'''
         <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.08) 0%, rgba(255, 255, 255, 0.04) 100%);
@@ -1390,303 +1036,232 @@ with col_right:
             </div>
             <p style="margin-top: 16px; padding-top: 16px; border-top: 1px solid rgba(255,255,255,0.1); 
                       color: rgba(255,255,255,0.6); font-size: 13px;">
-                Last Update: <strong style="color: rgba(255,255,255,0.9);">{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</strong>
+                Last Update: <strong style="color: rgba(255,255,255,0.9);">{now_str}</strong>
             </p>
         </div>
     ''', unsafe_allow_html=True)
 
 # Operational Environment Indicators
 st.markdown('<div style="margin-top: 30px;"></div>', unsafe_allow_html=True)
-st.markdown('<div class="section-header">Operational Environment Intelligence</div>', unsafe_allow_html=True)
+st.markdown(_SECTION_HDR_TMPL.format("Operational Environment Intelligence"), unsafe_allow_html=True)
+
+# Article card markup, filled per article from article_card_fields()
+_NEWS_CARD_TMPL = """
+    <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.08) 0%, rgba(255, 255, 255, 0.03) 100%);
+                padding: 20px; border-radius: 12px; margin-bottom: 16px;
+                border: 1px solid rgba(255, 255, 255, 0.15);
+                transition: all 0.3s ease;">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+            <div style="flex: 1;">
+                <span style="background: {cat_color}; color: white; padding: 4px 10px; border-radius: 6px; 
+                            font-size: 11px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">{category}</span>
+                <span style="background: {sentiment_color}; color: white; padding: 4px 10px; border-radius: 6px; 
+                            font-size: 11px; font-weight: 600; margin-left: 8px; text-transform: uppercase;">{sentiment_indicator}</span>
+            </div>
+            <span style="color: rgba(255,255,255,0.5); font-size: 12px;">{time_str}</span>
+        </div>
+        <h4 style="color: white; font-size: 16px; font-weight: 600; margin: 0 0 12px 0; line-height: 1.4;">
+            {idx}. {title_trunc}
+        </h4>
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <span style="color: rgba(255,255,255,0.6); font-size: 13px;">Source: <strong style="color: rgba(255,255,255,0.85);">{source}</strong></span>
+            <a href="{url}" target="_blank" style="color: #4facfe; font-size: 13px; font-weight: 600; text-decoration: none;
+                      padding: 6px 14px; border: 1px solid #4facfe; border-radius: 6px; transition: all 0.2s ease;"
+               onmouseover="this.style.background='#4facfe'; this.style.color='white';"
+               onmouseout="this.style.background='transparent'; this.style.color='#4facfe';">Read Article →</a>
+        </div>
+    </div>
+"""
+_SOURCE_ARTICLE_CARD_TMPL = """
+    <div style="background: linear-gradient(135deg, rgba(255,255,255,0.06) 0%, rgba(255,255,255,0.02) 100%);
+                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
+                border: 1px solid rgba(255,255,255,0.1);">
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
+            <div style="display: flex; gap: 8px; align-items: center;">
+                <span style="background: #2563eb; color: white; padding: 3px 10px; border-radius: 4px; 
+                            font-size: 11px; font-weight: 600; text-transform: uppercase;">{category}</span>
+                <span style="color: {sentiment_color}; font-size: 12px; font-weight: 500;">
+                    Sentiment: {sentiment:.2f}</span>
+            </div>
+            <span style="color: rgba(255,255,255,0.5); font-size: 12px;">{time_short}</span>
+        </div>
+        <h4 style="color: white; margin: 0 0 12px 0; font-size: 15px; line-height: 1.4; font-weight: 500;">{title}</h4>
+        <a href="{url}" target="_blank" style="color: #4facfe; text-decoration: none; font-size: 13px; font-weight: 600;">Read Article &rarr;</a>
+    </div>
+"""
+
+# Sentiment bands: (-inf, -0.2] negative, (-0.2, 0.2] neutral, (0.2, inf) positive;
+# bisect_left over the cut points gives the band index directly
+_SENTIMENT_CUTS = (-0.2, 0.2)
+_SENTIMENT_BANDS = (("negative", "#ef4444"), ("neutral", "#6b7280"), ("positive", "#10b981"))
+
+
+def _truncate(text, limit=120):
+    """Text cut to `limit` characters with an ellipsis; short text is returned as-is"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+@lru_cache(maxsize=2048)
+def article_card_fields(article):
+    """Display fields for an article card, derived once per (immutable) ArticleRecord"""
+    sent_raw = article.sentiment
+    sentiment = float(sent_raw) if sent_raw is not None else 0.0
+    category = str(article.category or 'general')
+    title_str = str(article.title or '')
+    collected_at = article.collected_at
+    sentiment_indicator, sentiment_color = _SENTIMENT_BANDS[bisect_left(_SENTIMENT_CUTS, sentiment)]
+    return {
+        'category': category,
+        'cat_color': CATEGORY_COLOR.get(category, DEFAULT_CATEGORY_COLOR),
+        'sentiment': sentiment,
+        'sentiment_indicator': sentiment_indicator,
+        'sentiment_color': sentiment_color,
+        'time_str': collected_at.strftime('%b %d, %Y at %H:%M') if collected_at else '',
+        'time_short': collected_at.strftime('%b %d, %H:%M') if collected_at else '',
+        'title': title_str,
+        'title_trunc': _truncate(title_str),
+        'source': str(article.source or ''),
+        'url': str(article.url or ''),
+    }
+
+
+# Tab renderers - they receive the data fetched above rather than querying the
+# database again.
+def render_news_feed(articles):
+    if articles:
+        feed_header = f'''
+            <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.15) 0%, rgba(8, 145, 178, 0.1) 100%); 
+                        padding: 16px 24px; border-radius: 12px; margin-bottom: 24px;
+                        border-left: 4px solid #2563eb; backdrop-filter: blur(10px);">
+                <p style="color: white; margin: 0; font-size: 15px; font-weight: 600;">
+                    Displaying <span style="color: #4facfe; font-weight: 700;">{min(20, len(articles))}</span> of 
+                    <span style="color: #4facfe; font-weight: 700;">{len(articles)}</span> articles in selected time range
+                </p>
+            </div>
+        '''
+        
+        # All cards go out in one markdown element
+        cards = [
+            _NEWS_CARD_TMPL.format(idx=idx, **article_card_fields(article))
+            for idx, article in enumerate(articles[:20], 1)
+        ]
+        st.markdown(feed_header + "".join(cards), unsafe_allow_html=True)
+    else:
+        st.info("No articles found in the selected time range. Try expanding the time range or selecting more sources.")
+
+
+def render_activity_timeline(timeline_rows, live_window=False):
+    if timeline_rows:
+        if live_window:
+            # Live windows refresh often - native Arrow-backed chart keeps the payload small
+            st.line_chart(timeline_frame(timeline_rows), x='hour', y='count', color='category', height=650)
+            return
+        
+        st.plotly_chart(build_timeline_figure(tuple(timeline_rows)), width='stretch')
+    else:
+        st.info("Not enough data for timeline visualization")
+
+
+def render_deep_analysis(articles, columns):
+    st.markdown('<p style="color: white; font-size: 20px; font-weight: 800; margin-bottom: 20px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%); padding: 14px 20px; border-radius: 16px; border: 2px solid rgba(255, 255, 255, 0.4); backdrop-filter: blur(20px); box-shadow: 0 4px 20px rgba(31, 38, 135, 0.25), inset 0 1px 0 rgba(255,255,255,0.5); text-shadow: 0 2px 8px rgba(0,0,0,0.3);">Category Breakdown & Sentiment Analysis</p>', unsafe_allow_html=True)
+    
+    if articles:
+        # Category sentiment analysis, aggregated from the shared column view
+        cat_rows = tuple(processor.summarize_categories(articles, columns))
+        cat_sentiment = category_sentiment_frame(cat_rows)
+        
+        st.plotly_chart(build_sentiment_figure(cat_rows), width='stretch')
+        
+        # Show table with simple styling
+        st.markdown('<p style="color: white; font-weight: 800; margin-top: 24px; font-size: 17px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%); padding: 12px 18px; border-radius: 14px; border: 2px solid rgba(255, 255, 255, 0.4); backdrop-filter: blur(20px); box-shadow: 0 4px 20px rgba(31, 38, 135, 0.25), inset 0 1px 0 rgba(255,255,255,0.5); text-shadow: 0 2px 6px rgba(0,0,0,0.3);">Detailed Statistics</p>', unsafe_allow_html=True)
+        st.dataframe(
+            cat_sentiment,
+            hide_index=True
+        )
+    else:
+        st.info("No data available for analysis. Collect more articles to see detailed insights.")
+
+
+def render_source_tab(source, source_articles, source_risks, source_opps):
+    st.markdown(f'''
+        <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.1) 0%, rgba(8, 145, 178, 0.05) 100%);
+                    padding: 20px 24px; border-radius: 12px; margin-bottom: 24px; border-left: 4px solid #2563eb;">
+            <h3 style="color: white; margin: 0; font-size: 20px; font-weight: 700;">{source}</h3>
+            <p style="color: rgba(255,255,255,0.6); margin: 8px 0 0 0; font-size: 14px;">Intelligence Report & Analysis</p>
+        </div>
+    ''', unsafe_allow_html=True)
+    
+    # Source Metrics with cleaner styling
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Articles", len(source_articles))
+    with col2:
+        st.metric("Risk Alerts", len(source_risks))
+    with col3:
+        st.metric("Opportunities", len(source_opps))
+    
+    st.markdown("---")
+    
+    # Risks for this source - header and cards go out as one element when there are cards
+    risk_header = _CARD_SECTION_HDR_TMPL.format("Risk Alerts")
+    if source_risks:
+        st.markdown(risk_header + risk_cards_html(source_risks[:5]), unsafe_allow_html=True)
+    else:
+        st.markdown(risk_header, unsafe_allow_html=True)
+        st.success("No risk alerts from this source")
+    
+    st.markdown("---")
+    
+    # Opportunities for this source
+    opp_header = _CARD_SECTION_HDR_TMPL.format("Opportunities")
+    if source_opps:
+        st.markdown(opp_header + opportunity_cards_html(source_opps[:5]), unsafe_allow_html=True)
+    else:
+        st.markdown(opp_header, unsafe_allow_html=True)
+        st.info("No opportunities identified from this source")
+    
+    st.markdown("---")
+    
+    # Recent articles from this source
+    articles_header = _CARD_SECTION_HDR_TMPL.format("Recent Articles")
+    if source_articles:
+        cards = [_SOURCE_ARTICLE_CARD_TMPL.format_map(article_card_fields(article)) for article in source_articles[:10]]
+        st.markdown(articles_header + "".join(cards), unsafe_allow_html=True)
+    else:
+        st.markdown(articles_header, unsafe_allow_html=True)
+        st.info(f"No articles found from {source}")
 
-# Create tabs for each source plus overview
-source_tabs = ["Overview"] + [f"{source}" for source in sorted(selected_sources)]
-tabs = st.tabs(source_tabs)
+
+# Create tabs for each source plus overview. The tabs track which one is open
+# (switching reruns the script), so hidden source tabs are skipped entirely
+tab_sources = tuple(sorted(selected_sources))
+tabs = st.tabs(("Overview",) + tab_sources, key="dashboard_tab", on_change="rerun")
 
 # Overview Tab
 with tabs[0]:
     tab1, tab2, tab3 = st.tabs(["Latest News Feed", "Activity Timeline", "Deep Analysis"])
     
     with tab1:
-        if articles:
-            st.markdown(f'''
-                <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.15) 0%, rgba(8, 145, 178, 0.1) 100%); 
-                            padding: 16px 24px; border-radius: 12px; margin-bottom: 24px;
-                            border-left: 4px solid #2563eb; backdrop-filter: blur(10px);">
-                    <p style="color: white; margin: 0; font-size: 15px; font-weight: 600;">
-                        Displaying <span style="color: #4facfe; font-weight: 700;">{min(20, len(articles))}</span> of 
-                        <span style="color: #4facfe; font-weight: 700;">{len(articles)}</span> articles in selected time range
-                    </p>
-                </div>
-            ''', unsafe_allow_html=True)
-            
-            # Show recent articles
-            for idx, article in enumerate(articles[:20], 1):
-                sent_raw = getattr(article, 'sentiment', None)
-                sentiment = float(sent_raw) if sent_raw is not None else 0.0
-                sentiment_indicator = "positive" if sentiment > 0.2 else "neutral" if sentiment > -0.2 else "negative"
-                sentiment_color = "#10b981" if sentiment > 0.2 else "#6b7280" if sentiment > -0.2 else "#ef4444"
-                category = str(getattr(article, 'category', None) or 'general')
-            
-            # Color code by category
-            cat_colors = {
-                'economy': '#2563eb',
-                'politics': '#dc2626',
-                'technology': '#059669',
-                'business': '#0891b2',
-                'general': '#64748b'
-            }
-            cat_color = cat_colors.get(category, '#757575')
-            
-            title_str = str(getattr(article, 'title', '') or '')
-            url_str = str(getattr(article, 'url', '') or '')
-            source_str = str(getattr(article, 'source', '') or '')
-            collected_at = getattr(article, 'collected_at', None)
-            time_str = collected_at.strftime('%b %d, %Y at %H:%M') if collected_at else ''
-            
-            # Clean article card without emojis
-            st.markdown(f'''
-                <div style="background: linear-gradient(135deg, rgba(255, 255, 255, 0.08) 0%, rgba(255, 255, 255, 0.03) 100%);
-                            padding: 20px; border-radius: 12px; margin-bottom: 16px;
-                            border: 1px solid rgba(255, 255, 255, 0.15);
-                            transition: all 0.3s ease;">
-                    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
-                        <div style="flex: 1;">
-                            <span style="background: {cat_color}; color: white; padding: 4px 10px; border-radius: 6px; 
-                                        font-size: 11px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">{category}</span>
-                            <span style="background: {sentiment_color}; color: white; padding: 4px 10px; border-radius: 6px; 
-                                        font-size: 11px; font-weight: 600; margin-left: 8px; text-transform: uppercase;">{sentiment_indicator}</span>
-                        </div>
-                        <span style="color: rgba(255,255,255,0.5); font-size: 12px;">{time_str}</span>
-                    </div>
-                    <h4 style="color: white; font-size: 16px; font-weight: 600; margin: 0 0 12px 0; line-height: 1.4;">
-                        {idx}. {title_str[:120]}{'...' if len(title_str) > 120 else ''}
-                    </h4>
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <span style="color: rgba(255,255,255,0.6); font-size: 13px;">Source: <strong style="color: rgba(255,255,255,0.85);">{source_str}</strong></span>
-                        <a href="{url_str}" target="_blank" style="color: #4facfe; font-size: 13px; font-weight: 600; text-decoration: none;
-                                  padding: 6px 14px; border: 1px solid #4facfe; border-radius: 6px; transition: all 0.2s ease;"
-                           onmouseover="this.style.background='#4facfe'; this.style.color='white';"
-                           onmouseout="this.style.background='transparent'; this.style.color='#4facfe';">Read Article →</a>
-                    </div>
-                </div>
-            ''', unsafe_allow_html=True)
-        else:
-            st.info("No articles found in the selected time range. Try expanding the time range or selecting more sources.")
+        render_news_feed(articles)
 
     with tab2:
-        if articles:
-            # Create timeline
-            df_timeline = pd.DataFrame([
-                {'time': getattr(a, 'collected_at', None), 'category': str(getattr(a, 'category', None) or 'general')}
-                for a in articles
-            ])
-            
-            # Group by hour and category
-            df_timeline['hour'] = pd.to_datetime(df_timeline['time']).dt.floor('h')
-            timeline_counts = df_timeline.groupby(['hour', 'category']).size().reset_index(name='count')
-            
-            fig_timeline = px.line(
-                timeline_counts,
-                x='hour',
-                y='count',
-                color='category',
-                title='Article Activity Over Time',
-                labels={'hour': 'Time', 'count': 'Number of Articles', 'category': 'Category'},
-                color_discrete_sequence=['#2563eb', '#0891b2', '#059669', '#1a365d', '#7c3aed', '#dc2626']
-            )
-            fig_timeline.update_layout(
-                height=650,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(family="Inter, sans-serif", size=13, color='white'),
-                title_font_size=18,
-                title_font_color='white',
-                title_font_weight=700,
-                hovermode='x unified',
-                legend=dict(font=dict(size=12, color='white'), bgcolor='rgba(255,255,255,0.1)', bordercolor='rgba(255,255,255,0.3)', borderwidth=2)
-            )
-            fig_timeline.update_traces(line_width=4, marker_size=8)
-            fig_timeline.update_xaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
-            fig_timeline.update_yaxes(tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)')
-            st.plotly_chart(fig_timeline, width='stretch')
-        else:
-            st.info("Not enough data for timeline visualization")
+        timeline_rows = get_timeline_rows(hours_start, hours_end, tuple(selected_sources), window_digest)
+        render_activity_timeline(timeline_rows, live_window)
 
     with tab3:
-        st.markdown('<p style="color: white; font-size: 20px; font-weight: 800; margin-bottom: 20px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%); padding: 14px 20px; border-radius: 16px; border: 2px solid rgba(255, 255, 255, 0.4); backdrop-filter: blur(20px); box-shadow: 0 4px 20px rgba(31, 38, 135, 0.25), inset 0 1px 0 rgba(255,255,255,0.5); text-shadow: 0 2px 8px rgba(0,0,0,0.3);">Category Breakdown & Sentiment Analysis</p>', unsafe_allow_html=True)
-        
-        if articles:
-            # Create dataframe from articles
-            df_proc = pd.DataFrame([{
-                'category': str(getattr(a, 'category', None) or 'general'),
-                'sentiment': float(getattr(a, 'sentiment', None) or 0),
-                'title': str(getattr(a, 'title', '') or '')
-            } for a in articles])
-            
-            # Category sentiment analysis
-            cat_sentiment = df_proc.groupby('category').agg({
-                'sentiment': 'mean',
-                'title': 'count'
-            }).reset_index()
-            cat_sentiment.columns = ['Category', 'Avg Sentiment', 'Article Count']
-            
-            fig_sentiment = go.Figure()
-            fig_sentiment.add_trace(go.Bar(
-                x=cat_sentiment['Category'],
-                y=cat_sentiment['Article Count'],
-                name='Articles',
-                marker_color='rgba(37, 99, 235, 0.8)',
-                marker_line_color='rgba(37, 99, 235, 1)',
-                marker_line_width=1.5
-            ))
-            fig_sentiment.add_trace(go.Scatter(
-                x=cat_sentiment['Category'],
-                y=cat_sentiment['Avg Sentiment'],
-                name='Sentiment',
-                yaxis='y2',
-                marker_color='#059669',
-                marker_size=10,
-                line=dict(width=3, color='#059669')
-            ))
-            
-            fig_sentiment.update_layout(
-                title='Category Analysis: Volume vs Sentiment',
-                yaxis=dict(title='Article Count', title_font=dict(color='white', size=14, weight=700), tickfont=dict(size=12, color='white'), gridcolor='rgba(255,255,255,0.1)'),
-                yaxis2=dict(title='Avg Sentiment', overlaying='y', side='right', title_font=dict(color='white', size=14, weight=700), tickfont=dict(size=12, color='white')),
-                height=650,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(family="Inter, sans-serif", size=13, color='white'),
-                title_font_size=18,
-                title_font_color='white',
-                title_font_weight=700,
-                hovermode='x unified',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=12, color='white'), bgcolor='rgba(255,255,255,0.1)', bordercolor='rgba(255,255,255,0.3)', borderwidth=2)
-            )
-            
-            st.plotly_chart(fig_sentiment, width='stretch')
-            
-            # Show table with simple styling
-            st.markdown('<p style="color: white; font-weight: 800; margin-top: 24px; font-size: 17px; background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.08) 100%); padding: 12px 18px; border-radius: 14px; border: 2px solid rgba(255, 255, 255, 0.4); backdrop-filter: blur(20px); box-shadow: 0 4px 20px rgba(31, 38, 135, 0.25), inset 0 1px 0 rgba(255,255,255,0.5); text-shadow: 0 2px 6px rgba(0,0,0,0.3);">Detailed Statistics</p>', unsafe_allow_html=True)
-            st.dataframe(
-                cat_sentiment,
-                hide_index=True
-            )
-        else:
-            st.info("No data available for analysis. Collect more articles to see detailed insights.")
+        render_deep_analysis(articles, columns)
 
-# Per-Source Analysis Tabs
-for idx, source in enumerate(sorted(selected_sources), 1):
+# Per-Source Analysis Tabs - only the open one is built
+for idx, source in enumerate(tab_sources, 1):
+    if not tabs[idx].open:
+        continue
     with tabs[idx]:
-        st.markdown(f'''
-            <div style="background: linear-gradient(135deg, rgba(37, 99, 235, 0.1) 0%, rgba(8, 145, 178, 0.05) 100%);
-                        padding: 20px 24px; border-radius: 12px; margin-bottom: 24px; border-left: 4px solid #2563eb;">
-                <h3 style="color: white; margin: 0; font-size: 20px; font-weight: 700;">{source}</h3>
-                <p style="color: rgba(255,255,255,0.6); margin: 8px 0 0 0; font-size: 14px;">Intelligence Report & Analysis</p>
-            </div>
-        ''', unsafe_allow_html=True)
-        
         # Filter articles for this source
-        source_articles = [a for a in articles if str(getattr(a, 'source', '')) == source]
+        source_rows = processor.index_by_source(articles, (source,), columns=columns)
+        source_articles = [articles[i] for i in source_rows.get(source, ())]
         source_risks = risks_by_source.get(source, [])
         source_opps = opportunities_by_source.get(source, [])
-        
-        # Source Metrics with cleaner styling
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Articles", len(source_articles))
-        with col2:
-            st.metric("Risk Alerts", len(source_risks))
-        with col3:
-            st.metric("Opportunities", len(source_opps))
-        
-        st.markdown("---")
-        
-        # Risks for this source
-        st.markdown('<div class="section-header">Risk Alerts</div>', unsafe_allow_html=True)
-        if source_risks:
-            for risk in source_risks[:5]:
-                severity = risk.get('severity', 'low')
-                severity_color = "#ef4444" if severity == "high" else "#f59e0b" if severity == "medium" else "#10b981"
-                description = risk.get('description', 'No description')
-                category = risk.get('category', 'General')
-                
-                st.markdown(f'''
-                    <div style="background: linear-gradient(135deg, rgba(255,255,255,0.08) 0%, rgba(255,255,255,0.03) 100%);
-                                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
-                                border-left: 4px solid {severity_color};">
-                        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-                            <span style="background: {severity_color}; color: white; padding: 4px 10px; border-radius: 4px;
-                                        font-size: 11px; font-weight: 700; text-transform: uppercase;">{severity}</span>
-                            <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
-                        </div>
-                        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
-                    </div>
-                ''', unsafe_allow_html=True)
-        else:
-            st.success("No risk alerts from this source")
-        
-        st.markdown("---")
-        
-        # Opportunities for this source
-        st.markdown('<div class="section-header">Opportunities</div>', unsafe_allow_html=True)
-        if source_opps:
-            for opp in source_opps[:5]:
-                description = opp.get('description', 'No description')
-                category = opp.get('category', 'General')
-                sentiment = opp.get('sentiment', 0)
-                
-                st.markdown(f'''
-                    <div style="background: linear-gradient(135deg, rgba(79, 172, 254, 0.1) 0%, rgba(0, 242, 254, 0.05) 100%);
-                                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
-                                border-left: 4px solid #4facfe;">
-                        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-                            <span style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; 
-                                        padding: 4px 10px; border-radius: 4px; font-size: 11px; font-weight: 700;">OPPORTUNITY</span>
-                            <span style="color: rgba(255,255,255,0.7); font-size: 13px;">{category}</span>
-                            <span style="color: #10b981; font-size: 12px; margin-left: auto;">Sentiment: {sentiment:.2f}</span>
-                        </div>
-                        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 14px; line-height: 1.5;">{description}</p>
-                    </div>
-                ''', unsafe_allow_html=True)
-        else:
-            st.info("No opportunities identified from this source")
-        
-        st.markdown("---")
-        
-        # Recent articles from this source
-        st.markdown('<div class="section-header">Recent Articles</div>', unsafe_allow_html=True)
-        if source_articles:
-            for article in source_articles[:10]:
-                sent_raw = getattr(article, 'sentiment', None)
-                sentiment = float(sent_raw) if sent_raw is not None else 0.0
-                sentiment_color = "#10b981" if sentiment > 0.2 else "#6b7280" if sentiment > -0.2 else "#ef4444"
-                category = str(getattr(article, 'category', None) or 'general')
-                title_str = str(getattr(article, 'title', '') or '')
-                url_str = str(getattr(article, 'url', '') or '')
-                collected_at = getattr(article, 'collected_at', None)
-                time_str = collected_at.strftime('%b %d, %H:%M') if collected_at else ''
-                
-                st.markdown(f'''
-                    <div style="background: linear-gradient(135deg, rgba(255,255,255,0.06) 0%, rgba(255,255,255,0.02) 100%);
-                                padding: 16px 20px; border-radius: 10px; margin-bottom: 12px;
-                                border: 1px solid rgba(255,255,255,0.1);">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                            <div style="display: flex; gap: 8px; align-items: center;">
-                                <span style="background: #2563eb; color: white; padding: 3px 10px; border-radius: 4px; 
-                                            font-size: 11px; font-weight: 600; text-transform: uppercase;">{category}</span>
-                                <span style="color: {sentiment_color}; font-size: 12px; font-weight: 500;">
-                                    Sentiment: {sentiment:.2f}</span>
-                            </div>
-                            <span style="color: rgba(255,255,255,0.5); font-size: 12px;">{time_str}</span>
-                        </div>
-                        <h4 style="color: white; margin: 0 0 12px 0; font-size: 15px; line-height: 1.4; font-weight: 500;">{title_str}</h4>
-                        <a href="{url_str}" target="_blank" style="color: #4facfe; text-decoration: none; font-size: 13px; font-weight: 600;">Read Article &rarr;</a>
-                    </div>
-                ''', unsafe_allow_html=True)
-        else:
-            st.info(f"No articles found from {source}")
+        render_source_tab(source, source_articles, source_risks, source_opps)
 
 # Footer
 st.markdown('<div style="margin-top: 40px;"></div>', unsafe_allow_html=True)
@@ -1702,7 +1277,7 @@ st.markdown(f'''
             Real-Time Monitoring & Strategic Insights
         </p>
         <p style="color: rgba(255,255,255,0.5); font-size: 12px; margin-top: 12px;">
-            Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            Last Updated: {now_str}
         </p>
     </div>
 ''', unsafe_allow_html=True)
@@ -2,19 +2,73 @@
 Database manager for storing and retrieving news articles and signals
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Float
+from sqlalchemy import create_engine, event, inspect, text, func, Column, ForeignKey, Index, Integer, String, DateTime, Text, Float, insert, update
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
-import os
-import sys
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+import hashlib
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import DATABASE_PATH
 
 Base = declarative_base()
 
+# Applied to every new SQLite connection. WAL lets the dashboard read while the
+# scraper/scheduler writes, and with synchronous=NORMAL a commit no longer fsyncs
+# (durability is kept at checkpoints; a power cut can lose only the last commits).
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',  # 256 MB
+    'PRAGMA cache_size=-65536',    # 64 MB
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def _window_filter(query, hours, hours_end=None, sources=None):
+    """Restrict an articles query to a time window and, optionally, to sources
+    
+    Args:
+        hours: Start of range (hours ago from now) - for week ranges, this is the START (older)
+        hours_end: End of range (hours ago from now) - if None, the range runs up to now
+        sources: Optional list of source names to filter by
+    """
+    now = datetime.now()
+    
+    # For week-based ranges: hours_end is closer to now, hours is further back
+    if hours_end is not None:
+        # Normalize bounds so older >= newer; if equal, treat newer as now
+        start_hours = float(hours)
+        end_hours = float(hours_end)
+        if start_hours < end_hours:
+            start_hours, end_hours = end_hours, start_hours
+        if start_hours == end_hours:
+            end_hours = 0.0
+        query = query.filter(
+            Article.collected_at >= now - timedelta(hours=start_hours),  # Older boundary
+            Article.collected_at < now - timedelta(hours=end_hours)      # Newer boundary
+        )
+    else:
+        # Simple range: everything from the last N hours
+        query = query.filter(Article.collected_at >= now - timedelta(hours=float(hours)))
+    
+    if sources:
+        query = query.filter(Article.source.in_(sources))
+    return query
+
+def article_hash(title):
+    """Stable content hash of an article (its title), used to reuse classifications"""
+    return hashlib.blake2b((title or '').strip().encode('utf-8'), digest_size=16).hexdigest()
+
+
 class Article(Base):
     """Article model for storing news articles"""
     __tablename__ = 'articles'
@@ -22,11 +76,46 @@ class Article(Base):
     id = Column(Integer, primary_key=True)
     title = Column(Text, nullable=False)
     url = Column(String(500), unique=True, nullable=False)
-    source = Column(String(100), nullable=False)
+    source = Column(String(100), nullable=False, index=True)
     category = Column(String(50))
     sentiment = Column(Float)
     collected_at = Column(DateTime, default=datetime.now)
     processed = Column(Integer, default=0)  # 0 = not processed, 1 = processed
+    article_hash = Column(String(32), index=True)  # see article_hash()
+    tokenized = Column(Integer, default=0)  # 1 once keyword tokens were stored (a title may yield none)
+    
+    # Every dashboard read is a collected_at range, optionally narrowed by source
+    # or grouped by category; the unprocessed and untokenized backlogs are found by their flags
+    __table_args__ = (
+        Index('ix_articles_collected_source', 'collected_at', 'source'),
+        Index('ix_articles_collected_category', 'collected_at', 'category'),
+        Index('ix_articles_processed', 'processed'),
+        Index('ix_articles_tokenized', 'tokenized'),
+    )
+
+class ArticleToken(Base):
+    """Keyword occurrences per article, written when the article is processed"""
+    __tablename__ = 'article_tokens'
+    
+    article_id = Column(Integer, ForeignKey('articles.id'), primary_key=True)
+    token = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=1)
+
+class ArticleRecord(NamedTuple):
+    """Plain, picklable snapshot of an Article row (safe to cache outside a session)"""
+    id: int
+    title: str
+    url: str
+    source: str
+    category: Optional[str]
+    sentiment: Optional[float]
+    collected_at: Optional[datetime]
+    processed: int
+    
+    @classmethod
+    def from_article(cls, article):
+        return cls(article.id, article.title, article.url, article.source, article.category,
+                   article.sentiment, article.collected_at, article.processed)
 
 class Signal(Base):
     """Signal model for storing detected signals"""
@@ -39,6 +128,19 @@ class Signal(Base):
     category = Column(String(50))
     detected_at = Column(DateTime, default=datetime.now)
     meta_data = Column(Text)  # JSON string for additional data
+    
+    # get_recent_signals: detected_at range, optionally one signal type, newest first
+    __table_args__ = (
+        Index('ix_signals_detected_type', 'detected_at', 'signal_type'),
+    )
+
+class FeedValidator(Base):
+    """HTTP validators of each RSS feed's last stored response, for conditional fetches"""
+    __tablename__ = 'feed_validators'
+    
+    feed_url = Column(String(500), primary_key=True)
+    etag = Column(String(200))
+    last_modified = Column(String(100))
 
 class DatabaseManager:
     """Manages database operations"""
@@ -48,10 +150,66 @@ class DatabaseManager:
         if db_path is None:
             db_path = DATABASE_PATH
         
-        self.engine = create_engine(f'sqlite:///{db_path}')
+        # Connections are pooled and may be handed to any thread; each call gets its
+        # own session below, so the dashboard's script threads, the auto-collect
+        # worker and the scheduler never share one connection
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            connect_args={'check_same_thread': False},
+            pool_size=4,
+            max_overflow=8
+        )
+        event.listen(self.engine, 'connect', _apply_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        # create_all skips existing tables, so add columns and indexes introduced later
+        self._add_article_hash_column()
+        self._add_tokenized_column()
+        with self.engine.begin() as conn:
+            # Duplicated the (article_id, token) primary key index, doubling token writes
+            conn.execute(text('DROP INDEX IF EXISTS ix_article_tokens_covering'))
+        inspector = inspect(self.engine)
+        missing = []
+        for table in (Article.__table__, ArticleToken.__table__, Signal.__table__):
+            existing = {index['name'] for index in inspector.get_indexes(table.name)}
+            missing += [index for index in table.indexes if index.name not in existing]
+        for index in missing:
+            index.create(self.engine)
+        if missing:
+            # Without statistics SQLite prefers the single-column source index over
+            # the collected_at range for "window AND source IN (...)" reads
+            with self.engine.begin() as conn:
+                conn.execute(text('ANALYZE'))
+        # Every method opens a short-lived session and closes it before returning
+        # (commit or rollback included), so its pooled connection goes straight back
+        # and no thread keeps one checked out between calls
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+    
+    def _add_article_hash_column(self):
+        """Add and backfill articles.article_hash on databases created before it existed"""
+        columns = {column['name'] for column in inspect(self.engine).get_columns('articles')}
+        if 'article_hash' in columns:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text('ALTER TABLE articles ADD COLUMN article_hash VARCHAR(32)'))
+            rows = conn.execute(text('SELECT id, title FROM articles')).all()
+            if rows:
+                conn.execute(
+                    text('UPDATE articles SET article_hash = :h WHERE id = :id'),
+                    [{'h': article_hash(title), 'id': article_id} for article_id, title in rows]
+                )
+    
+    def _add_tokenized_column(self):
+        """Add articles.tokenized on databases created before it existed, set for
+        articles that already have stored tokens"""
+        columns = {column['name'] for column in inspect(self.engine).get_columns('articles')}
+        if 'tokenized' in columns:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text('ALTER TABLE articles ADD COLUMN tokenized INTEGER DEFAULT 0'))
+            conn.execute(text(
+                'UPDATE articles SET tokenized = 1 '
+                'WHERE EXISTS (SELECT 1 FROM article_tokens WHERE article_tokens.article_id = articles.id)'
+            ))
     
     def add_article(self, title, url, source, category=None, sentiment=None):
         """Add a new article to the database"""
@@ -61,30 +219,136 @@ class DatabaseManager:
                 url=url,
                 source=source,
                 category=category,
-                sentiment=sentiment
+                sentiment=sentiment,
+                article_hash=article_hash(title)
             )
-            self.session.add(article)
-            self.session.commit()
+            with self.Session.begin() as session:
+                session.add(article)
             return article.id
         except Exception as e:
-            self.session.rollback()
             # Likely a duplicate URL
             return None
     
+    def add_articles_bulk(self, articles, chunk_size=1000):
+        """Insert many articles in one transaction, skipping URLs already stored
+        
+        Args:
+            articles: Iterable of dicts with title, url, source (category/sentiment optional)
+            chunk_size: Rows per executemany batch
+            
+        Returns:
+            Number of new rows inserted
+        """
+        rows = [
+            {
+                'title': a['title'],
+                'url': a['url'],
+                'source': a['source'],
+                'category': a.get('category'),
+                'sentiment': a.get('sentiment'),
+                'article_hash': article_hash(a['title']),
+            }
+            for a in articles
+        ]
+        if not rows:
+            return 0
+        
+        stmt = insert(Article.__table__).prefix_with('OR IGNORE')
+        inserted = 0
+        # Commits on success; rolls back and re-raises on any error
+        with self.Session.begin() as session:
+            for i in range(0, len(rows), chunk_size):
+                result = session.execute(stmt, rows[i:i + chunk_size])
+                inserted += max(result.rowcount, 0)
+        return inserted
+    
     def get_unprocessed_articles(self):
         """Get all articles that haven't been processed yet"""
-        return self.session.query(Article).filter(Article.processed == 0).all()
+        with self.Session() as session:
+            return session.query(Article).filter(Article.processed == 0).all()
+    
+    def get_unprocessed_rows(self):
+        """(id, title, source, article_hash) of unprocessed articles, loaded as plain column tuples"""
+        with self.Session() as session:
+            return session.query(Article.id, Article.title, Article.source, Article.article_hash).filter(Article.processed == 0).all()
+    
+    def count_unprocessed(self):
+        """Count articles still waiting to be categorised"""
+        with self.Session() as session:
+            return session.query(Article).filter(Article.processed == 0).count()
+    
+    def get_known_classifications(self, hashes, chunk_size=500):
+        """Map content hash -> (category, sentiment) for already-processed articles"""
+        hashes = list(set(hashes))
+        known = {}
+        with self.Session() as session:
+            for i in range(0, len(hashes), chunk_size):
+                rows = session.query(Article.article_hash, Article.category, Article.sentiment).filter(
+                    Article.processed == 1,
+                    Article.category.isnot(None),
+                    Article.article_hash.in_(hashes[i:i + chunk_size])
+                )
+                for digest, category, sentiment in rows:
+                    known.setdefault(digest, (category, sentiment))
+        return known
     
     def mark_article_processed(self, article_id, category=None, sentiment=None):
-        """Mark an article as processed"""
-        article = self.session.query(Article).filter(Article.id == article_id).first()
-        if article:
-            setattr(article, 'processed', 1)
-            if category:
-                setattr(article, 'category', category)
-            if sentiment is not None:
-                setattr(article, 'sentiment', sentiment)
-            self.session.commit()
+        """Mark an article as processed (one UPDATE; no row is loaded first)"""
+        values = {'processed': 1}
+        if category:
+            values['category'] = category
+        if sentiment is not None:
+            values['sentiment'] = sentiment
+        with self.Session.begin() as session:
+            session.execute(update(Article).where(Article.id == article_id).values(**values))
+    
+    def mark_articles_processed(self, updates, token_rows=None, chunk_size=1000):
+        """Mark many articles processed with one UPDATE batch per chunk and a single commit
+        
+        Args:
+            updates: Iterable of (article_id, category, sentiment) tuples
+            token_rows: Optional (article_id, token, count) rows stored in the same
+                transaction; when given (even empty), the articles are also marked tokenized
+        """
+        tokenized = {'tokenized': 1} if token_rows is not None else {}
+        rows = [
+            {'id': article_id, 'processed': 1, 'category': category, 'sentiment': sentiment, **tokenized}
+            for article_id, category, sentiment in updates
+        ]
+        if not rows:
+            return
+        with self.Session.begin() as session:
+            for i in range(0, len(rows), chunk_size):
+                session.execute(update(Article), rows[i:i + chunk_size])
+            self._insert_token_rows(session, token_rows or (), chunk_size)
+    
+    def add_article_tokens(self, rows, article_ids=(), chunk_size=1000):
+        """Store (article_id, token, count) rows, replacing earlier counts for the same pair
+        
+        Args:
+            rows: (article_id, token, count) rows
+            article_ids: Articles to mark tokenized in the same transaction, including
+                those whose titles yielded no rows
+        """
+        flags = [{'id': article_id, 'tokenized': 1} for article_id in article_ids]
+        with self.Session.begin() as session:
+            for i in range(0, len(flags), chunk_size):
+                session.execute(update(Article), flags[i:i + chunk_size])
+            self._insert_token_rows(session, rows, chunk_size)
+    
+    @staticmethod
+    def _insert_token_rows(session, rows, chunk_size):
+        """Execute INSERT OR REPLACE batches for token rows in the session's transaction; returns the row count"""
+        rows = [{'article_id': article_id, 'token': token, 'count': count} for article_id, token, count in rows]
+        stmt = insert(ArticleToken.__table__).prefix_with('OR REPLACE')
+        for i in range(0, len(rows), chunk_size):
+            session.execute(stmt, rows[i:i + chunk_size])
+        return len(rows)
+    
+    def get_articles_missing_tokens(self):
+        """(id, title) of processed articles that have not been tokenized yet"""
+        with self.Session() as session:
+            return session.query(Article.id, Article.title).filter(Article.processed == 1, Article.tokenized == 0).all()
     
     def get_recent_articles(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
         """Get articles from a specific time range (supports week-based filtering)
@@ -94,41 +358,43 @@ class DatabaseManager:
             hours_end: End of range (hours ago from now) - if None, uses 0 (now)
             sources: Optional list of source names to filter by
         """
-        from datetime import datetime, timedelta
-        now = datetime.now()
+        with self.Session() as session:
+            query = _window_filter(session.query(Article), hours, hours_end, sources)
+            return query.order_by(Article.collected_at.desc()).all()
+    
+    def get_recent_records(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """Same window as get_recent_articles, as ArticleRecord tuples loaded column-wise
         
-        # For week-based ranges: hours_end is closer to now, hours is further back
-        if hours_end is not None:
-            # Normalize bounds so older >= newer; if equal, treat newer as now
-            start_hours = float(hours)
-            end_hours = float(hours_end)
-            if start_hours < end_hours:
-                start_hours, end_hours = end_hours, start_hours
-            if start_hours == end_hours:
-                end_hours = 0.0
-            cutoff_start = now - timedelta(hours=start_hours)  # Older boundary
-            cutoff_end = now - timedelta(hours=end_hours)      # Newer boundary
-            query = self.session.query(Article).filter(
-                Article.collected_at >= cutoff_start,
-                Article.collected_at < cutoff_end
-            )
-        else:
-            # Simple range: get all articles from last N hours
-            cutoff = now - timedelta(hours=float(hours))
-            query = self.session.query(Article).filter(Article.collected_at >= cutoff)
+        Skips ORM object construction and the session identity map; use it for
+        read-only consumers.
+        """
+        return list(self.iter_recent_records(hours=hours, hours_end=hours_end, sources=sources))
+    
+    def iter_recent_records(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """Lazy form of get_recent_records for single-pass consumers
+        
+        Rows are fetched 1000 at a time as the iterator advances, so the window is
+        never held in memory at once. The window is fixed when this is called; the
+        session is closed once the iterator is exhausted or discarded.
+        """
+        session = self.Session()
+        query = session.query(*(getattr(Article, field) for field in ArticleRecord._fields))
+        query = _window_filter(query, hours, hours_end, sources).order_by(Article.collected_at.desc())
+        
+        def records():
+            with session:
+                yield from map(ArticleRecord._make, query.yield_per(1000))
         
-        if sources:
-            query = query.filter(Article.source.in_(sources))
-        return query.order_by(Article.collected_at.desc()).all()
+        return records()
     
     def get_articles_by_category(self, category, hours=24):
         """Get articles of a specific category from the last N hours (supports fractional hours)"""
-        from datetime import datetime, timedelta
         cutoff = datetime.now() - timedelta(hours=float(hours))
-        return self.session.query(Article).filter(
-            Article.category == category,
-            Article.collected_at >= cutoff
-        ).order_by(Article.collected_at.desc()).all()
+        with self.Session() as session:
+            return session.query(Article).filter(
+                Article.category == category,
+                Article.collected_at >= cutoff
+            ).order_by(Article.collected_at.desc()).all()
     
     def add_signal(self, signal_type, description, severity=None, category=None, meta_data=None):
         """Add a new signal to the database"""
@@ -139,85 +405,130 @@ class DatabaseManager:
             category=category,
             meta_data=meta_data
         )
-        self.session.add(signal)
-        self.session.commit()
+        with self.Session.begin() as session:
+            session.add(signal)
         return signal.id
     
     def get_recent_signals(self, signal_type=None, hours=24):
         """Get recent signals, optionally filtered by type (supports fractional hours)"""
-        from datetime import datetime, timedelta
         cutoff = datetime.now() - timedelta(hours=float(hours))
-        query = self.session.query(Signal).filter(Signal.detected_at >= cutoff)
-        if signal_type:
-            query = query.filter(Signal.signal_type == signal_type)
-        return query.order_by(Signal.detected_at.desc()).all()
+        with self.Session() as session:
+            query = session.query(Signal).filter(Signal.detected_at >= cutoff)
+            if signal_type:
+                query = query.filter(Signal.signal_type == signal_type)
+            return query.order_by(Signal.detected_at.desc()).all()
     
     def get_category_distribution(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
         """Get distribution of articles by category (supports week-based filtering)"""
-        from datetime import datetime, timedelta
-        from sqlalchemy import func
-        now = datetime.now()
-        
-        if hours_end is not None:
-            start_hours = float(hours)
-            end_hours = float(hours_end)
-            if start_hours < end_hours:
-                start_hours, end_hours = end_hours, start_hours
-            if start_hours == end_hours:
-                end_hours = 0.0
-            cutoff_start = now - timedelta(hours=start_hours)
-            cutoff_end = now - timedelta(hours=end_hours)
-            query = self.session.query(Article.category, func.count(Article.id)).filter(
-                Article.collected_at >= cutoff_start,
-                Article.collected_at < cutoff_end,
-                Article.category.isnot(None)
-            )
-        else:
-            cutoff = now - timedelta(hours=float(hours))
-            query = self.session.query(Article.category, func.count(Article.id)).filter(
-                Article.collected_at >= cutoff,
-                Article.category.isnot(None)
-            )
-        
-        if sources:
-            query = query.filter(Article.source.in_(sources))
-        
-        results = query.group_by(Article.category).all()
+        with self.Session() as session:
+            query = session.query(Article.category, func.count(Article.id)).filter(Article.category.isnot(None))
+            results = _window_filter(query, hours, hours_end, sources).group_by(Article.category).all()
         return {category: count for category, count in results}
     
     def get_source_distribution(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
         """Get distribution of articles by source (supports week-based filtering)"""
-        from datetime import datetime, timedelta
-        from sqlalchemy import func
-        now = datetime.now()
-        
-        if hours_end is not None:
-            start_hours = float(hours)
-            end_hours = float(hours_end)
-            if start_hours < end_hours:
-                start_hours, end_hours = end_hours, start_hours
-            if start_hours == end_hours:
-                end_hours = 0.0
-            cutoff_start = now - timedelta(hours=start_hours)
-            cutoff_end = now - timedelta(hours=end_hours)
-            query = self.session.query(Article.source, func.count(Article.id)).filter(
-                Article.collected_at >= cutoff_start,
-                Article.collected_at < cutoff_end
+        with self.Session() as session:
+            query = session.query(Article.source, func.count(Article.id))
+            results = _window_filter(query, hours, hours_end, sources).group_by(Article.source).all()
+        return {source: count for source, count in results}
+    
+    def get_sentiment_by_category(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """Average sentiment per category over scored articles in the window, averaged in SQLite"""
+        with self.Session() as session:
+            query = session.query(Article.category, func.avg(Article.sentiment)).filter(
+                Article.category.isnot(None),
+                Article.category != '',
+                Article.sentiment.isnot(None)
             )
-        else:
-            cutoff = now - timedelta(hours=float(hours))
-            query = self.session.query(Article.source, func.count(Article.id)).filter(Article.collected_at >= cutoff)
+            query = _window_filter(query, hours, hours_end, sources)
+            
+            results = query.group_by(Article.category).order_by(Article.category).all()
+        return {category: float(average) for category, average in results}
+    
+    def get_window_aggregates(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """(category, source, count, average sentiment) for every group in the window, in one scan
         
-        if sources:
-            query = query.filter(Article.source.in_(sources))
+        Callers needing several distributions over the same window fold these rows
+        instead of issuing one aggregate query each. Category may be None; the
+        average is None when no article of the group has been scored.
+        """
+        with self.Session() as session:
+            query = session.query(Article.category, Article.source, func.count(Article.id), func.avg(Article.sentiment))
+            return _window_filter(query, hours, hours_end, sources).group_by(Article.category, Article.source).all()
+    
+    def get_window_digest(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """Cheap change signature of a window: (max id, row count, processed count)
         
-        results = query.group_by(Article.source).all()
-        return {source: count for source, count in results}
+        Equal digests mean no article was added, aged out or re-processed in between.
+        """
+        with self.Session() as session:
+            query = session.query(func.max(Article.id), func.count(Article.id), func.sum(Article.processed))
+            max_id, count, processed = _window_filter(query, hours, hours_end, sources).one()
+        return (max_id or 0, count, processed or 0)
+    
+    def get_top_tokens(self, hours: float = 168, hours_end: "float | None" = None, sources=None, limit=20):
+        """Most frequent stored tokens for articles in the window, counted inside SQLite
+        
+        Returns:
+            List of (token, count), most frequent first (ties alphabetical)
+        """
+        total = func.sum(ArticleToken.count).label('total')
+        with self.Session() as session:
+            query = session.query(ArticleToken.token, total).join(Article, Article.id == ArticleToken.article_id)
+            query = _window_filter(query, hours, hours_end, sources)
+            
+            results = query.group_by(ArticleToken.token).order_by(total.desc(), ArticleToken.token).limit(limit).all()
+        return [(token, int(count)) for token, count in results]
+    
+    def get_hourly_category_counts(self, hours: float = 24, hours_end: "float | None" = None, sources=None):
+        """Get article counts per (hour, category) bucket, aggregated inside SQLite
+        
+        Returns:
+            List of (hour 'YYYY-MM-DD HH:00:00', category, count) ordered by hour
+        """
+        hour_bucket = func.strftime('%Y-%m-%d %H:00:00', Article.collected_at).label('hour')
+        category = func.coalesce(Article.category, 'general').label('category')
+        with self.Session() as session:
+            query = session.query(hour_bucket, category, func.count(Article.id))
+            query = _window_filter(query, hours, hours_end, sources)
+            
+            results = query.group_by(hour_bucket, category).order_by(hour_bucket).all()
+        return [(hour, cat, count) for hour, cat, count in results]
+    
+    def list_sources(self, hours: "float | None" = None):
+        """Get distinct source names, optionally only those seen in the last N hours
+        
+        Answered from the source index without per-source counts (the dashboard
+        memoises the result with st.cache_data).
+        """
+        with self.Session() as session:
+            query = session.query(Article.source).distinct()
+            if hours is not None:
+                query = query.filter(Article.collected_at >= datetime.now() - timedelta(hours=float(hours)))
+            return tuple(source for (source,) in query.order_by(Article.source))
+    
+    def get_feed_validators(self):
+        """Map feed URL -> (etag, last_modified) as stored by save_feed_validators"""
+        with self.Session() as session:
+            rows = session.query(FeedValidator.feed_url, FeedValidator.etag, FeedValidator.last_modified)
+            return {feed_url: (etag, last_modified) for feed_url, etag, last_modified in rows}
+    
+    def save_feed_validators(self, validators):
+        """Store feed URL -> (etag, last_modified), replacing earlier values for the same feed"""
+        rows = [
+            {'feed_url': feed_url, 'etag': etag, 'last_modified': last_modified}
+            for feed_url, (etag, last_modified) in validators.items()
+        ]
+        if not rows:
+            return
+        with self.Session.begin() as session:
+            session.execute(insert(FeedValidator.__table__).prefix_with('OR REPLACE'), rows)
     
     def get_total_articles(self):
         """Get total number of articles in database"""
-        return self.session.query(Article).count()
+        with self.Session() as session:
+            return session.query(Article).count()
     
     def close(self):
-        """Close database session"""
-        self.session.close()
+        """Close the pooled connections (every method already returns its own)"""
+        self.engine.dispose()
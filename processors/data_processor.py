@@ -1,21 +1,32 @@
 """Data processor for categorizing, scoring, and aggregating news articles."""
 
-import sys
-import os
-from collections import Counter, defaultdict
+from collections import Counter
+from functools import lru_cache
+import importlib.util
+from operator import attrgetter
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import CATEGORIES, CATEGORY_MIN_CONFIDENCE
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, article_hash
 
-try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
-except ImportError:
-    TEXTBLOB_AVAILABLE = False
+# TextBlob pulls in nltk (about a second to import), so only check that it is
+# installed here and import it on the first sentiment call
+TEXTBLOB_AVAILABLE = importlib.util.find_spec('textblob') is not None
+
+
+@lru_cache(maxsize=None)
+def _pattern_sentiment():
+    """Return TextBlob's lexicon scorer, importing textblob on first call.
+
+    TextBlob(text).sentiment.polarity is this scorer's polarity; calling it directly
+    skips building a blob and a result namedtuple class per title.
+    """
+    from textblob.en import sentiment
+    return sentiment
 
 # Import ML classifier
 try:
@@ -25,6 +36,92 @@ except ImportError:
     ML_CLASSIFIER_AVAILABLE = False
 
 
+# Common words never reported as keywords/trending topics
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that',
+    'these', 'those', 'sri', 'lanka', 'lankan', 'says', 'said'
+})
+_KEYWORD_RE = re.compile(r'\b[a-z]{4,}\b')  # applied to lowercased text
+
+# Fields pulled into ArticleColumns, read in one C-level call per article
+_COLUMN_FIELDS = attrgetter('title', 'sentiment', 'source', 'category', 'collected_at')
+
+
+@lru_cache(maxsize=None)
+def compile_keyword(keyword: str) -> "re.Pattern[str]":
+    """Compiled word-boundary pattern for a lowercase keyword, built once per process."""
+    return re.compile(r'\b' + re.escape(keyword.lower()) + r'\b')
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def _build_keyword_index():
+    """Map each keyword's leading word -> [(order, category, pattern, weight)].
+
+    A word-boundary match of a keyword always starts at a title word equal to the
+    keyword's leading word, so only keywords whose leading word occurs in the title
+    can match; keywords that do not start with a word character are always tried.
+    Single-word keywords get pattern None: their matches are exactly the title
+    words equal to them, so they are counted without running a regex.
+    """
+    index: Dict[Optional[str], List[Tuple[int, str, 're.Pattern[str]', float]]] = {}
+    order = 0
+    for category, keywords in CATEGORIES.items():
+        for keyword_entry in keywords:
+            # Handle both weighted (tuple) and legacy (string) formats
+            if isinstance(keyword_entry, tuple):
+                keyword, weight = keyword_entry
+            else:
+                keyword, weight = keyword_entry, 1
+            leading = re.match(r'\w+', keyword.lower())
+            single_word = leading is not None and leading.group() == keyword.lower()
+            index.setdefault(leading.group() if leading else None, []).append(
+                (order, category, None if single_word else compile_keyword(keyword), weight)
+            )
+            order += 1
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
+def score_keywords(title_lower: str) -> Dict[str, float]:
+    """Weighted CATEGORIES keyword matches per category for a lowercased title.
+
+    Only keywords whose leading word appears in the title can match; they are
+    scored in config order, so sums and dict order match a full keyword scan.
+    """
+    word_counts = Counter(_WORD_RE.findall(title_lower))
+    candidates = [(entry, 0) for entry in _KEYWORD_INDEX.get(None, ())]
+    for word, count in word_counts.items():
+        candidates.extend((entry, count) for entry in _KEYWORD_INDEX.get(word, ()))
+    candidates.sort(key=lambda candidate: candidate[0][0])
+
+    category_scores: Dict[str, float] = {}
+    for (_, category, pattern, weight), count in candidates:
+        # A single-word keyword matches once per equal title word; others use
+        # word boundary matching to avoid partial matches
+        matches = count if pattern is None else len(pattern.findall(title_lower))
+        if matches > 0:
+            category_scores[category] = category_scores.get(category, 0.0) + weight * matches
+    return category_scores
+
+
+class ArticleColumns(NamedTuple):
+    """Column-oriented (one array per field) view of a batch of articles."""
+    title_len: np.ndarray        # int32
+    sentiment: np.ndarray        # float64, NaN when unscored
+    collected_ts: np.ndarray     # int64 epoch seconds
+    source_id: np.ndarray        # int32 codes into source_names
+    source_names: np.ndarray     # sorted unique source labels
+    category_id: np.ndarray      # int32 codes into category_names
+    category_names: np.ndarray   # sorted unique category labels
+
+
 class DataProcessor:
     """Processes news articles with configurable time windows and ML classification."""
 
@@ -41,6 +138,30 @@ class DataProcessor:
             if not self._ml_classifier.is_trained:
                 self._train_ml_model()
 
+        # Articles processed before tokens were stored get them once here
+        self._backfill_tokens()
+
+    def warm_up(self):
+        """Pay one-off start-up costs now: the sentiment lexicon import and the
+        first pass through the classifier (sparse/BLAS code paths)."""
+        self.analyze_sentiment('warm up')
+        self.categorize_articles_with_confidence(['Economy update for Sri Lanka'])
+
+    def _backfill_tokens(self):
+        """Tokenize processed articles that have no stored tokens yet."""
+        missing = self.db.get_articles_missing_tokens()
+        if missing:
+            # Flagged even when a title yields no tokens, so it is not picked up again
+            self.db.add_article_tokens(self._token_rows(missing), article_ids=[article_id for article_id, _ in missing])
+
+    def _token_rows(self, id_titles) -> List[Tuple[int, str, int]]:
+        """(article_id, token, count) rows for (id, title) pairs."""
+        return [
+            (article_id, token, count)
+            for article_id, title in id_titles
+            for token, count in Counter(self.extract_keywords(title or '')).items()
+        ]
+
     def _train_ml_model(self) -> Dict:
         """Train ML model using database articles."""
         if not self._ml_classifier:
@@ -77,17 +198,28 @@ class DataProcessor:
         Returns:
             Tuple of (category, confidence_score)
         """
-        # Get keyword-based result
-        keyword_cat, keyword_conf = self._keyword_categorize(title)
-        
-        # Try ML classification if available
-        ml_cat, ml_conf = None, 0.0
-        if self.use_ml and self._ml_classifier and self._ml_classifier.is_trained:
+        return self.categorize_articles_with_confidence([title])[0]
+    
+    def categorize_articles_with_confidence(self, titles: List[str]) -> List[Tuple[str, float]]:
+        """Batch form of categorize_article_with_confidence: one ML call for all titles."""
+        ml_results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(titles)
+        if titles and self.use_ml and self._ml_classifier and self._ml_classifier.is_trained:
             try:
-                ml_cat, ml_conf = self._ml_classifier.predict(title)
+                ml_results = self._ml_classifier.predict_batch(titles)
             except Exception:
                 pass
         
+        return [
+            self._combine_predictions(self._keyword_categorize(title), ml_result)
+            for title, ml_result in zip(titles, ml_results)
+        ]
+    
+    @staticmethod
+    def _combine_predictions(keyword_result: Tuple[str, float], ml_result: Tuple[Optional[str], float]) -> Tuple[str, float]:
+        """Hybrid decision between keyword and ML (category, confidence) results."""
+        keyword_cat, keyword_conf = keyword_result
+        ml_cat, ml_conf = ml_result
+        
         # Hybrid decision logic
         if ml_cat and ml_conf >= 0.5:
             # ML is confident - use ML result
@@ -112,30 +244,7 @@ class DataProcessor:
     
     def _keyword_categorize(self, title: str) -> Tuple[str, float]:
         """Keyword-based categorization fallback."""
-        title_lower = title.lower()
-        
-        category_scores: Dict[str, float] = {}
-        
-        for category, keywords in CATEGORIES.items():
-            score = 0.0
-            for keyword_entry in keywords:
-                # Handle both weighted (tuple) and legacy (string) formats
-                if isinstance(keyword_entry, tuple):
-                    keyword, weight = keyword_entry
-                else:
-                    keyword, weight = keyword_entry, 1
-                
-                keyword_lower = keyword.lower()
-                
-                # Use word boundary matching to avoid partial matches
-                pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-                matches = len(re.findall(pattern, title_lower))
-                
-                if matches > 0:
-                    score += weight * matches
-            
-            if score > 0:
-                category_scores[category] = score
+        category_scores = score_keywords(title.lower())
         
         if not category_scores:
             return ('general', 0.0)
@@ -159,47 +268,56 @@ class DataProcessor:
         if not TEXTBLOB_AVAILABLE or not text:
             return 0.0
         try:
-            blob = TextBlob(text)
-            return float(blob.sentiment.polarity)  # type: ignore[union-attr]
+            polarity, _ = _pattern_sentiment()(text)
+            return float(polarity)
         except Exception:
             return 0.0
 
     def extract_keywords(self, title: str) -> List[str]:
         """Extract keywords (>=4 letters) excluding common stop words."""
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that',
-            'these', 'those', 'sri', 'lanka', 'lankan', 'says', 'said'
-        }
-
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', title.lower())
-        return [w for w in words if w not in stop_words]
+        return [w for w in _KEYWORD_RE.findall(title.lower()) if w not in _STOP_WORDS]
 
     # ----------------------
     # Processing pipeline
     # ----------------------
     def process_articles(self) -> List[dict]:
-        """Process all unprocessed articles: categorize + sentiment."""
-        articles = self.db.get_unprocessed_articles()
+        """Process all unprocessed articles: categorize + sentiment (written back in one batch).
+
+        Articles whose content hash matches an already-processed article reuse its
+        category/sentiment instead of being classified again.
+        """
+        # Only the columns needed here are loaded (no ORM objects)
+        rows = self.db.get_unprocessed_rows()
         processed = []
 
-        for article in articles:
-            title_str = getattr(article, 'title', '') or ''
-            category = self.categorize_article(title_str)
-            sentiment = self.analyze_sentiment(title_str)
+        hashes = [stored_hash or article_hash(title) for _, title, _, stored_hash in rows]
+        known = self.db.get_known_classifications(hashes) if rows else {}
 
-            self.db.mark_article_processed(getattr(article, 'id', None), category, sentiment)
+        # Classify every not-yet-seen title in a single batched ML call
+        new_titles = {}
+        for (_, title, _, _), digest in zip(rows, hashes):
+            if digest not in known:
+                new_titles.setdefault(digest, title or '')
+        categories = self.categorize_articles_with_confidence(list(new_titles.values()))
+        for (digest, title_str), (category, _) in zip(new_titles.items(), categories):
+            known[digest] = (category, self.analyze_sentiment(title_str))
+
+        for (article_id, title, source, _), digest in zip(rows, hashes):
+            category, sentiment = known[digest]
 
             processed.append({
-                'id': getattr(article, 'id', None),
-                'title': title_str,
+                'id': article_id,
+                'title': title or '',
                 'category': category,
                 'sentiment': sentiment,
-                'source': getattr(article, 'source', '') or ''
+                'source': source or ''
             })
 
+        # Classifications and keyword tokens are written in one transaction (one commit)
+        self.db.mark_articles_processed(
+            ((p['id'], p['category'], p['sentiment']) for p in processed),
+            token_rows=self._token_rows((p['id'], p['title']) for p in processed),
+        )
         return processed
 
     # ----------------------
@@ -212,7 +330,48 @@ class DataProcessor:
         sources: Optional[Iterable[str]] = None,
     ):
         """Fetch articles within (hours_start -> hours_end] window ago."""
-        return self.db.get_recent_articles(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
+        return self.db.get_recent_records(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
+
+    @staticmethod
+    def to_columns(articles) -> ArticleColumns:
+        """Pull article fields out once into contiguous arrays for vectorised scoring."""
+        # One pass over the articles, then transposed into per-field tuples
+        titles, sentiments, sources, categories, collected = tuple(zip(*map(_COLUMN_FIELDS, articles))) or ((),) * 5
+        source_names, source_id = np.unique(
+            np.array([str(s or '') for s in sources], dtype=object).astype(str),
+            return_inverse=True,
+        )
+        category_names, category_id = np.unique(
+            np.array([str(c or 'general') for c in categories], dtype=object).astype(str),
+            return_inverse=True,
+        )
+        return ArticleColumns(
+            title_len=np.fromiter((len(t or '') for t in titles), dtype=np.int32, count=len(titles)),
+            sentiment=np.array([np.nan if v is None else float(v) for v in sentiments], dtype=np.float64),
+            # pandas converts datetime objects in C; np.array(..., 'datetime64[s]') is ~7x slower
+            collected_ts=pd.to_datetime(list(collected)).values.astype('datetime64[s]').astype(np.int64),
+            source_id=source_id.astype(np.int32),
+            source_names=source_names,
+            category_id=category_id.astype(np.int32),
+            category_names=category_names,
+        )
+
+    def index_by_source(
+        self,
+        articles,
+        sources: Optional[Iterable[str]] = None,
+        columns: Optional[ArticleColumns] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Row positions of each source's articles, found via integer source codes."""
+        cols = columns if columns is not None else self.to_columns(articles)
+        order = np.argsort(cols.source_id, kind='stable')  # keeps newest-first order within a source
+        bounds = np.searchsorted(cols.source_id[order], np.arange(len(cols.source_names) + 1))
+        wanted = set(sources) if sources is not None else None
+        return {
+            str(name): order[bounds[code]:bounds[code + 1]]
+            for code, name in enumerate(cols.source_names)
+            if wanted is None or name in wanted
+        }
 
     # ----------------------
     # Analytics
@@ -224,14 +383,24 @@ class DataProcessor:
         sources: Optional[Iterable[str]] = None,
         top_n: int = 20,
         min_occurrences: int = 2,
+        articles=None,
     ) -> List[Tuple[str, int]]:
-        """Return top keywords for the window; enforces minimum occurrence."""
-        articles = self._get_articles_window(hours_start, hours_end, sources)
+        """Return top keywords for the window (or pre-fetched `articles`); enforces minimum occurrence.
 
-        keyword_counts = Counter()
-        for article in articles:
-            title_str = getattr(article, 'title', '') or ''
-            keyword_counts.update(self.extract_keywords(title_str))
+        Window queries are answered from the tokens stored at processing time;
+        pre-fetched articles are tokenized in memory.
+        """
+        if articles is None:
+            top = self.db.get_top_tokens(hours=hours_start, hours_end=hours_end,
+                                         sources=list(sources) if sources else None, limit=top_n)
+            return [(kw, cnt) for kw, cnt in top if cnt >= min_occurrences]
+
+        # One regex pass over all titles (newline-joined, so words never span
+        # titles); stop words are dropped from the counts afterwards
+        titles = '\n'.join(getattr(article, 'title', '') or '' for article in articles)
+        keyword_counts = Counter(_KEYWORD_RE.findall(titles.lower()))
+        for stop_word in _STOP_WORDS & keyword_counts.keys():
+            del keyword_counts[stop_word]
 
         return [(kw, cnt) for kw, cnt in keyword_counts.most_common(top_n) if cnt >= min_occurrences]
 
@@ -258,16 +427,15 @@ class DataProcessor:
         sources: Optional[Iterable[str]] = None,
     ) -> dict:
         """Average sentiment per category for the window."""
-        articles = self._get_articles_window(hours_start, hours_end, sources)
-
-        sentiment_data: defaultdict = defaultdict(list)
-        for article in articles:
-            cat_val = getattr(article, 'category', None)
-            sent_val = getattr(article, 'sentiment', None)
-            if cat_val and sent_val is not None:
-                sentiment_data[str(cat_val)].append(float(sent_val))
+        return self.db.get_sentiment_by_category(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
 
-        return {cat: (sum(vals) / len(vals)) for cat, vals in sentiment_data.items() if vals}
+    def summarize_categories(self, articles, columns: Optional[ArticleColumns] = None) -> List[Tuple[str, float, int]]:
+        """(category, mean sentiment, article count) per category; unscored articles count as neutral."""
+        cols = columns if columns is not None else self.to_columns(articles)
+        n_cats = len(cols.category_names)
+        totals = np.bincount(cols.category_id, weights=np.nan_to_num(cols.sentiment), minlength=n_cats)
+        counts = np.bincount(cols.category_id, minlength=n_cats)
+        return [(str(cat), float(totals[i] / counts[i]), int(counts[i])) for i, cat in enumerate(cols.category_names) if counts[i]]
 
     def close(self):
         """Close database connection."""
@@ -4,16 +4,14 @@ Provides more accurate categorization than keyword matching.
 """
 
 import os
-import sys
-import pickle
-import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Try to import ML libraries
 try:
+    import joblib
+    import numpy as np
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.naive_bayes import MultinomialNB
     from sklearn.pipeline import Pipeline
@@ -26,6 +24,30 @@ except ImportError:
 from utils.config import CATEGORIES, BUSINESS_CATEGORIES
 
 
+@lru_cache(maxsize=None)
+def _score_keywords():
+    """Return the data processor's keyword scorer.
+
+    Imported on first use: data_processor imports this module at load time.
+    """
+    from processors.data_processor import score_keywords
+    return score_keywords
+
+
+class _LettersAndSpaceTable(dict):
+    """str.translate table mapping every character except a-z and whitespace to a
+    space; entries are filled in on first sight, so any code point is covered."""
+    
+    def __missing__(self, code):
+        char = chr(code)
+        value = code if 'a' <= char <= 'z' or char.isspace() else ord(' ')
+        self[code] = value
+        return value
+
+
+_LETTERS_AND_SPACE = _LettersAndSpaceTable()
+
+
 class MLClassifier:
     """
     Machine Learning classifier for news articles.
@@ -51,13 +73,14 @@ class MLClassifier:
             
         if os.path.exists(self.MODEL_PATH):
             try:
-                with open(self.MODEL_PATH, 'rb') as f:
-                    data = pickle.load(f)
-                    self.model = data['model']
-                    self.category_labels = data['labels']
-                    self.training_accuracy = data.get('accuracy', 0.0)
-                    self.is_trained = True
-                    return True
+                # Loaded fully into memory (about 1 MB): a memory-mapped file could
+                # not be replaced by _save_model on Windows (also reads older plain pickles)
+                data = joblib.load(self.MODEL_PATH)
+                self.model = data['model']
+                self.category_labels = data['labels']
+                self.training_accuracy = data.get('accuracy', 0.0)
+                self.is_trained = True
+                return True
             except Exception as e:
                 print(f"Error loading model: {e}")
         return False
@@ -67,12 +90,15 @@ class MLClassifier:
         if not self.model:
             return False
         try:
-            with open(self.MODEL_PATH, 'wb') as f:
-                pickle.dump({
-                    'model': self.model,
-                    'labels': self.category_labels,
-                    'accuracy': self.training_accuracy
-                }, f)
+            # Write aside and swap in atomically, so a concurrent joblib.load never
+            # reads a partially written pickle
+            tmp_path = self.MODEL_PATH + '.tmp'
+            joblib.dump({
+                'model': self.model,
+                'labels': self.category_labels,
+                'accuracy': self.training_accuracy
+            }, tmp_path)
+            os.replace(tmp_path, self.MODEL_PATH)
             return True
         except Exception as e:
             print(f"Error saving model: {e}")
@@ -80,13 +106,9 @@ class MLClassifier:
     
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for ML model."""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^a-z\s]', ' ', text)
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        return text
+        # Lowercase, turn everything but letters and whitespace into spaces in one
+        # C-level translate pass, then collapse the whitespace
+        return ' '.join(text.lower().translate(_LETTERS_AND_SPACE).split())
     
     def _generate_training_data(self) -> Tuple[List[str], List[str]]:
         """
@@ -179,7 +201,8 @@ class MLClassifier:
                 ngram_range=(1, 2),  # Use unigrams and bigrams
                 max_features=5000,
                 min_df=1,
-                stop_words='english'
+                stop_words='english',
+                dtype=np.float32  # float32 features halve matrix memory traffic
             )),
             ('clf', MultinomialNB(alpha=0.1))  # Smoothing parameter
         ])
@@ -187,6 +210,12 @@ class MLClassifier:
         # Train the model
         self.model.fit(X_train, y_train)
         
+        # float32 log-probabilities are ample for argmax/confidence and keep
+        # the scoring matmul in single precision, matching the features
+        clf = self.model.named_steps['clf']
+        clf.feature_log_prob_ = clf.feature_log_prob_.astype(np.float32)
+        clf.class_log_prior_ = clf.class_log_prior_.astype(np.float32)
+        
         # Evaluate
         y_pred = self.model.predict(X_test)
         self.training_accuracy = accuracy_score(y_test, y_pred)
@@ -214,7 +243,7 @@ class MLClassifier:
             Dictionary with training metrics
         """
         # Get all processed articles
-        articles = db_manager.get_recent_articles(hours=720)  # 30 days
+        articles = db_manager.get_recent_records(hours=720)  # 30 days
         
         additional_data = []
         for article in articles:
@@ -240,16 +269,7 @@ class MLClassifier:
             return self._fallback_predict(title)
         
         try:
-            processed = self._preprocess_text(title)
-            
-            # Get prediction and probability
-            prediction = self.model.predict([processed])[0]
-            probabilities = self.model.predict_proba([processed])[0]
-            
-            # Get confidence (max probability)
-            confidence = float(max(probabilities))
-            
-            return (prediction, confidence)
+            return self.predict_batch([title])[0]
             
         except Exception as e:
             print(f"ML prediction error: {e}")
@@ -268,18 +288,23 @@ class MLClassifier:
         if not ML_AVAILABLE or not self.is_trained or not self.model:
             return [self._fallback_predict(t) for t in titles]
         
+        if not titles:
+            return []
+        
         try:
             processed = [self._preprocess_text(t) for t in titles]
             
-            predictions = self.model.predict(processed)
-            probabilities = self.model.predict_proba(processed)
-            
-            results = []
-            for pred, probs in zip(predictions, probabilities):
-                confidence = float(max(probs))
-                results.append((pred, confidence))
+            # One TF-IDF transform + NB pass; the prediction is the most probable class.
+            # The steps are called directly: Pipeline.predict_proba adds ~0.2 ms of
+            # dispatch per call, which dominates single-title predictions
+            steps = self.model.named_steps
+            clf = steps['clf']
+            probabilities = clf.predict_proba(steps['tfidf'].transform(processed))
+            best = probabilities.argmax(axis=1)
+            predictions = clf.classes_[best]
+            confidences = probabilities[np.arange(len(best)), best]
             
-            return results
+            return [(str(pred), float(conf)) for pred, conf in zip(predictions, confidences)]
             
         except Exception as e:
             print(f"ML batch prediction error: {e}")
@@ -287,25 +312,8 @@ class MLClassifier:
     
     def _fallback_predict(self, title: str) -> Tuple[str, float]:
         """Fallback to keyword-based prediction if ML unavailable."""
-        title_lower = title.lower()
-        
-        category_scores: Dict[str, float] = {}
-        
-        for category, keywords in CATEGORIES.items():
-            score = 0.0
-            for keyword_entry in keywords:
-                if isinstance(keyword_entry, tuple):
-                    keyword, weight = keyword_entry
-                else:
-                    keyword, weight = keyword_entry, 1.0
-                
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                matches = len(re.findall(pattern, title_lower))
-                if matches > 0:
-                    score += weight * matches
-            
-            if score > 0:
-                category_scores[category] = score
+        # Same indexed keyword scan as DataProcessor's keyword categorizer
+        category_scores = _score_keywords()(title.lower())
         
         if not category_scores:
             return ('general', 0.0)
@@ -2,24 +2,35 @@
 Signal detector for identifying risks, opportunities, trends, and anomalies
 """
 
-import sys
-import os
 import re
 from collections import Counter
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Iterable, Optional
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import RISK_KEYWORDS, OPPORTUNITY_KEYWORDS, TRENDING_THRESHOLD, ANOMALY_MULTIPLIER, SIGNAL_LOOKBACK_HOURS
 from database.db_manager import DatabaseManager
 from processors.data_processor import DataProcessor
 
 
-def _keyword_matches(keyword: str, text: str) -> bool:
-    """Check if keyword matches in text using word boundaries."""
-    pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-    return bool(re.search(pattern, text.lower()))
+def _compile_any(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """Single word-boundary alternation matching any of the keywords (one pass per title)."""
+    alternation = '|'.join(re.escape(k.lower()) for k in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(r'\b(?:' + alternation + r')\b')
+
+
+# Rank of each risk severity, most severe first
+SEVERITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+# Built once at import, checked in severity order
+_RISK_PATTERNS = tuple((severity, _compile_any(RISK_KEYWORDS[severity])) for severity in SEVERITY_ORDER)
+# All severities in one alternation: titles without any risk keyword (most of them)
+# are rejected by a single search
+_ANY_RISK_PATTERN = _compile_any(keyword for severity in SEVERITY_ORDER for keyword in RISK_KEYWORDS[severity])
+_OPPORTUNITY_PATTERN = _compile_any(OPPORTUNITY_KEYWORDS)
+
+# Most titles match nothing, so the remaining fields are read (in one call) only on a hit
+_SIGNAL_FIELDS = attrgetter('category', 'source', 'url', 'collected_at')
 
 
 class SignalDetector:
@@ -29,87 +40,59 @@ class SignalDetector:
         self.db = db or DatabaseManager()
         self.processor = processor or DataProcessor(db=self.db)
     
-    def detect_risks(self, hours_start: float = SIGNAL_LOOKBACK_HOURS, hours_end: float = 0, sources: Optional[Iterable[str]] = None):
-        """Detect risk signals from articles within the window."""
-        articles = self.db.get_recent_articles(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
+    def detect_risks(self, hours_start: float = SIGNAL_LOOKBACK_HOURS, hours_end: float = 0, sources: Optional[Iterable[str]] = None, articles=None):
+        """Detect risk signals from articles within the window (or from pre-fetched `articles`)."""
+        if articles is None:
+            articles = self.db.iter_recent_records(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
         risks = []
         
         for article in articles:
-            title_str = getattr(article, 'title', '') or ''
-            cat_str = getattr(article, 'category', None) or 'general'
-            source_str = getattr(article, 'source', '') or ''
-            url_str = getattr(article, 'url', '') or ''
+            title_str = article.title or ''
+            title_lower = title_str.lower()
+            if not _ANY_RISK_PATTERN.search(title_lower):
+                continue
             
-            # Check for high severity keywords with word boundaries
-            for keyword in RISK_KEYWORDS['high']:
-                if _keyword_matches(keyword, title_str):
+            # First severity level with a whole-word keyword hit wins
+            for severity, pattern in _RISK_PATTERNS:
+                if pattern.search(title_lower):
+                    cat_str, source_str, url_str, collected_at = _SIGNAL_FIELDS(article)
                     risks.append({
-                        'severity': 'high',
+                        'severity': severity,
                         'description': title_str,
-                        'category': str(cat_str),
-                        'source': str(source_str),
-                        'url': str(url_str),
-                        'detected_at': getattr(article, 'collected_at', None)
+                        'category': str(cat_str or 'general'),
+                        'source': str(source_str or ''),
+                        'url': str(url_str or ''),
+                        'detected_at': collected_at
                     })
                     break
-            else:
-                # Check for medium severity
-                for keyword in RISK_KEYWORDS['medium']:
-                    if _keyword_matches(keyword, title_str):
-                        risks.append({
-                            'severity': 'medium',
-                            'description': title_str,
-                            'category': str(cat_str),
-                            'source': str(source_str),
-                            'url': str(url_str),
-                            'detected_at': getattr(article, 'collected_at', None)
-                        })
-                        break
-                else:
-                    # Check for low severity
-                    for keyword in RISK_KEYWORDS['low']:
-                        if _keyword_matches(keyword, title_str):
-                            risks.append({
-                                'severity': 'low',
-                                'description': title_str,
-                                'category': str(cat_str),
-                                'source': str(source_str),
-                                'url': str(url_str),
-                                'detected_at': getattr(article, 'collected_at', None)
-                            })
-                            break
         
         # Sort by severity
-        severity_order = {'high': 0, 'medium': 1, 'low': 2}
-        risks.sort(key=lambda x: severity_order[x['severity']])
+        risks.sort(key=lambda x: SEVERITY_ORDER[x['severity']])
         
         return risks
     
-    def detect_opportunities(self, hours_start: float = SIGNAL_LOOKBACK_HOURS, hours_end: float = 0, sources: Optional[Iterable[str]] = None):
-        """Detect opportunity signals from articles within the window."""
-        articles = self.db.get_recent_articles(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
+    def detect_opportunities(self, hours_start: float = SIGNAL_LOOKBACK_HOURS, hours_end: float = 0, sources: Optional[Iterable[str]] = None, articles=None):
+        """Detect opportunity signals from articles within the window (or from pre-fetched `articles`)."""
+        if articles is None:
+            articles = self.db.iter_recent_records(hours=hours_start, hours_end=hours_end, sources=list(sources) if sources else None)
         opportunities = []
         
         for article in articles:
-            title_str = getattr(article, 'title', '') or ''
-            cat_str = getattr(article, 'category', None) or 'general'
-            source_str = getattr(article, 'source', '') or ''
-            url_str = getattr(article, 'url', '') or ''
-            sent_raw = getattr(article, 'sentiment', None)
-            sent_val = float(sent_raw) if sent_raw is not None else 0.0
+            title_str = article.title or ''
+            title_lower = title_str.lower()
             
             # Check for opportunity keywords with word boundaries
-            for keyword in OPPORTUNITY_KEYWORDS:
-                if _keyword_matches(keyword, title_str):
-                    opportunities.append({
-                        'description': title_str,
-                        'category': str(cat_str),
-                        'source': str(source_str),
-                        'url': str(url_str),
-                        'detected_at': getattr(article, 'collected_at', None),
-                        'sentiment': sent_val
-                    })
-                    break
+            if _OPPORTUNITY_PATTERN.search(title_lower):
+                cat_str, source_str, url_str, collected_at = _SIGNAL_FIELDS(article)
+                sent_raw = article.sentiment
+                opportunities.append({
+                    'description': title_str,
+                    'category': str(cat_str or 'general'),
+                    'source': str(source_str or ''),
+                    'url': str(url_str or ''),
+                    'detected_at': collected_at,
+                    'sentiment': float(sent_raw) if sent_raw is not None else 0.0
+                })
         
         # Sort by sentiment (most positive first)
         opportunities.sort(key=lambda x: x['sentiment'], reverse=True)
@@ -135,12 +118,12 @@ class SignalDetector:
         """Detect anomalies in news activity using recent vs baseline windows."""
         anomalies = []
         
-        # Get article counts for different time periods
-        recent_articles = self.db.get_recent_articles(hours=hours_recent)
-        baseline_articles = self.db.get_recent_articles(hours=hours_baseline)
+        # One grouped query per window yields both the article counts and the category split
+        recent_groups = self.db.get_window_aggregates(hours=hours_recent)
+        baseline_groups = self.db.get_window_aggregates(hours=hours_baseline)
         
-        recent_count = len(recent_articles)
-        baseline_avg = len(baseline_articles) / 24  # Average per hour
+        recent_count = sum(count for _, _, count, _ in recent_groups)
+        baseline_avg = sum(count for _, _, count, _ in baseline_groups) / 24  # Average per hour
         
         # Check if recent activity is anomalously high
         if recent_count > baseline_avg * ANOMALY_MULTIPLIER:
@@ -152,8 +135,14 @@ class SignalDetector:
             })
         
         # Check for category-specific anomalies
-        cat_dist = self.db.get_category_distribution(hours=hours_recent)
-        baseline_dist = self.db.get_category_distribution(hours=hours_baseline)
+        cat_dist = Counter()
+        for category, _, count, _ in recent_groups:
+            if category is not None:
+                cat_dist[category] += count
+        baseline_dist = Counter()
+        for category, _, count, _ in baseline_groups:
+            if category is not None:
+                baseline_dist[category] += count
         
         for category, count in cat_dist.items():
             baseline_count = baseline_dist.get(category, 0) / 24
@@ -170,9 +159,11 @@ class SignalDetector:
     
     def generate_all_signals(self):
         """Generate all types of signals"""
+        # Risks and opportunities scan the same default window, so it is fetched once
+        articles = self.db.get_recent_records(hours=SIGNAL_LOOKBACK_HOURS, hours_end=0)
         return {
-            'risks': self.detect_risks(),
-            'opportunities': self.detect_opportunities(),
+            'risks': self.detect_risks(articles=articles),
+            'opportunities': self.detect_opportunities(articles=articles),
             'trending': self.detect_trending_topics(),
             'anomalies': self.detect_anomalies()
         }
@@ -39,8 +39,11 @@ def run_collection():
         # Step 1: Scrape articles
         print("\n[1/3] Scraping news sources...")
         scraper = NewsScraper()
-        articles = scraper.scrape_all()
-        scraper.close()
+        try:
+            articles = scraper.scrape_all()
+        finally:
+            # Release the HTTP session and engine even when storing fails
+            scraper.close()
         
         # Count by source
         source_counts = {}
@@ -71,7 +74,8 @@ def run_collection():
         # Summary
         total = db.get_total_articles()
         enabled = get_enabled_sources()
-        recent_24h = len(db.get_recent_articles(hours=24, sources=enabled))
+        # Counted in SQLite (window digest) rather than by loading the rows
+        _, recent_24h, _ = db.get_window_digest(hours=24, sources=enabled)
         
         print(f"\n{'='*60}")
         print(f"Collection complete!")
@@ -104,7 +108,17 @@ Configuration:
 Press Ctrl+C to stop the scheduler.
 """)
     
+    # Load the model, sentiment lexicon and classifier code paths before the
+    # first cycle, so its timing is steady-state like the rest
+    db = DatabaseManager()
+    DataProcessor(db=db).warm_up()
+    db.close()
+    
     collection_count = 0
+    interval_seconds = interval_minutes * 60
+    # Cycles start on a fixed monotonic grid (start + N * interval), so the time a
+    # cycle takes does not push every later collection back
+    next_run = time.monotonic()
     
     while True:
         try:
@@ -112,22 +126,33 @@ Press Ctrl+C to stop the scheduler.
             print(f"\n[Collection #{collection_count}]")
             
             success = run_collection()
-            
-            if success:
-                print(f"\nNext collection in {interval_minutes} minutes...")
-            else:
-                print(f"\nRetrying in {interval_minutes} minutes...")
-            
-            # Sleep until next collection
-            time.sleep(interval_minutes * 60)
-            
         except KeyboardInterrupt:
             print("\n\nScheduler stopped by user.")
             break
         except Exception as e:
             print(f"\n[ERROR] Scheduler error: {e}")
-            print(f"Retrying in {interval_minutes} minutes...")
-            time.sleep(interval_minutes * 60)
+            success = False
+        
+        next_run += interval_seconds
+        sleep_for = next_run - time.monotonic()
+        if sleep_for <= 0:
+            # Overran the interval: start now and re-anchor the grid rather than
+            # running the missed cycles back to back
+            print(f"\n[WARN] Collection took longer than the {interval_minutes} minute interval")
+            next_run = time.monotonic()
+            sleep_for = 0
+        
+        if success:
+            print(f"\nNext collection in {sleep_for / 60:.1f} minutes...")
+        else:
+            print(f"\nRetrying in {sleep_for / 60:.1f} minutes...")
+        
+        try:
+            # Sleep until next collection
+            time.sleep(sleep_for)
+        except KeyboardInterrupt:
+            print("\n\nScheduler stopped by user.")
+            break
 
 
 def main():
@@ -3,453 +3,290 @@ News scraper for collecting articles from Sri Lankan news sources
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import UnicodeDammit
+import lxml.html
+from lxml import etree
 import feedparser
-import time
-import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.config import NEWS_SOURCES, SCRAPE_DELAY, REQUEST_TIMEOUT, MAX_ARTICLES_PER_SOURCE
+from utils.config import NEWS_SOURCES, REQUEST_TIMEOUT, MAX_ARTICLES_PER_SOURCE, SCRAPE_MAX_WORKERS
 from database.db_manager import DatabaseManager
 
+# Pages are re-encoded to UTF-8 after decoding, so the parser is told the encoding
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Compiled once and reused for every page (element.xpath() recompiles its expression)
+_HEADINGS = etree.XPath('//h2')
+_LINKS = etree.XPath('//a[@href]')
+
+
+def _parse_html(content):
+    """Parse a page body straight into an lxml tree.
+    
+    Bytes are decoded the way BeautifulSoup decodes them (declared charset, then
+    sniffing), so titles come out the same as before; lxml then builds the tree in
+    C without BeautifulSoup's per-node Python objects. An empty body yields an
+    empty document rather than an error.
+    """
+    if not content:
+        return lxml.html.Element('html')
+    markup = UnicodeDammit(content, is_html=True).unicode_markup or ''
+    try:
+        return lxml.html.document_fromstring(markup.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return lxml.html.Element('html')
+
+
+def _link_text(element):
+    """Stripped text of an element and its descendants, as a plain str."""
+    return str(element.text_content()).strip()
+
+
+def _canonical_url(url):
+    """Key for spotting the same article linked several times on one page.
+    
+    Lowercases the host and drops the fragment, utm_* tracking parameters and a
+    trailing slash; the rest of the query is kept (some sites carry the article id
+    there).
+    """
+    parts = urlsplit(url)
+    query = '&'.join(p for p in parts.query.split('&') if p and not p.startswith('utm_'))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
 class NewsScraper:
     """Scrapes news from configured sources"""
     
     def __init__(self):
         self.db = DatabaseManager()
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/rss+xml,application/xml;q=0.9,*/*;q=0.8',
+            # Compressed bodies, decoded transparently by requests (br would need brotli)
+            'Accept-Encoding': 'gzip, deflate'
         }
+        # One pooled HTTP session shared by the scraper threads (keep-alive reuse)
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=SCRAPE_MAX_WORKERS, pool_maxsize=SCRAPE_MAX_WORKERS)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        # (ETag, Last-Modified) of each feed's last stored response, and those of
+        # this run's responses, saved only once their articles are stored
+        self.feed_validators = self.db.get_feed_validators()
+        self.pending_validators = {}
+    
+    def _fetch_feed(self, url):
+        """Fetch an RSS feed over the pooled session (with the request timeout)
+        
+        The request is conditional on the validators of the last stored response.
+        Returns (body, validators), or (None, None) when the server answers 304
+        (feed unchanged since then).
+        """
+        headers = dict(self.headers)
+        etag, modified = self.feed_validators.get(url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        response = self.http.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            return None, None
+        response.raise_for_status()
+        return response.content, (response.headers.get('ETag'), response.headers.get('Last-Modified'))
     
-    def scrape_adaderana(self):
-        """Scrape Ada Derana news"""
+    def _scrape_adaderana(self, config):
+        """Scrape Ada Derana news (headline <h2> blocks, falling back to plain links)"""
         articles = []
+        seen_urls = set()
         try:
-            response = requests.get(
-                NEWS_SOURCES['adaderana']['url'],
+            response = self.http.get(
+                config['url'],
                 headers=self.headers,
                 timeout=REQUEST_TIMEOUT
             )
-            soup = BeautifulSoup(response.content, 'lxml')
+            # Error pages are reported, not parsed for links
+            response.raise_for_status()
+            root = _parse_html(response.content)
             
             # Try multiple selectors for Ada Derana
-            news_items = soup.find_all('h2')
+            news_items = _HEADINGS(root)
             if not news_items:
-                news_items = soup.find_all('a', href=True)
+                news_items = _LINKS(root)
             
             count = 0
             for item in news_items:
                 if count >= MAX_ARTICLES_PER_SOURCE:
                     break
                 try:
-                    if item.name == 'h2':
-                        link = item.find('a')
-                        if link:
-                            title = link.get_text().strip()
+                    if item.tag == 'h2':
+                        link = item.find('.//a')
+                        if link is not None:
+                            title = _link_text(link)
                             url = link.get('href', '')
                         else:
-                            title = item.get_text().strip()
+                            title = _link_text(item)
                             url = ''
                     else:
-                        title = item.get_text().strip()
+                        title = _link_text(item)
                         url = item.get('href', '')
                     
                     if title and len(title) > 20 and url:
                         url = str(url)
                         if not url.startswith('http'):
-                            url = 'http://www.adaderana.lk' + url
-                        articles.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'Ada Derana'
-                        })
-                        count += 1
-                except:
-                    continue
-        except Exception as e:
-            print(f"Error scraping Ada Derana: {e}")
-        
-        return articles
-    
-    def scrape_dailymirror(self):
-        """Scrape Daily Mirror news"""
-        articles = []
-        try:
-            response = requests.get(
-                NEWS_SOURCES['dailymirror']['url'],
-                headers=self.headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links that look like news articles
-            all_links = soup.find_all('a', href=True)
-            
-            count = 0
-            for link in all_links:
-                if count >= MAX_ARTICLES_PER_SOURCE:
-                    break
-                try:
-                    title = link.get_text().strip()
-                    url = link.get('href', '')
-                    
-                    # Filter for actual news articles
-                    url = str(url) if url else ''
-                    if (title and len(title) > 25 and url and 
-                        ('/news/' in url or '/breaking-news/' in url or '/latest-news/' in url)):
-                        if not url.startswith('http'):
-                            url = 'https://www.dailymirror.lk' + url
+                            url = config['base_url'] + url
+                        # The same article is often linked from several blocks
+                        key = _canonical_url(url)
+                        if key in seen_urls:
+                            continue
+                        seen_urls.add(key)
                         articles.append({
                             'title': title,
                             'url': url,
-                            'source': 'Daily Mirror'
+                            'source': config['name']
                         })
                         count += 1
-                except:
+                except Exception:
                     continue
         except Exception as e:
-            print(f"Error scraping Daily Mirror: {e}")
+            print(f"Error scraping {config['name']}: {e}")
         
         return articles
     
-    def scrape_newsfirst(self):
-        """Scrape News First"""
+    def _scrape_links(self, config):
+        """Scrape a front page for article links, using the source's NEWS_SOURCES rules"""
         articles = []
+        link_filters = config['link_filters']
+        seen_titles = set() if config.get('unique_titles') else None
+        seen_urls = set()
         try:
-            response = requests.get(
-                NEWS_SOURCES['newsfirst']['url'],
+            response = self.http.get(
+                config['url'],
                 headers=self.headers,
                 timeout=REQUEST_TIMEOUT
             )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links
-            all_links = soup.find_all('a', href=True)
+            # Error pages are reported, not parsed for links
+            response.raise_for_status()
+            root = _parse_html(response.content)
             
             count = 0
-            for link in all_links:
+            for link in _LINKS(root):
                 if count >= MAX_ARTICLES_PER_SOURCE:
                     break
                 try:
-                    title = link.get_text().strip()
+                    title = _link_text(link)
                     url = link.get('href', '')
                     
                     # Filter for news articles
                     url = str(url) if url else ''
-                    if title and len(title) > 25 and url and '202' in url:
+                    if title and len(title) > 25 and url and any(part in url for part in link_filters):
+                        if seen_titles is not None:
+                            if title in seen_titles:
+                                continue
+                            seen_titles.add(title)
                         if not url.startswith('http'):
-                            url = 'https://www.newsfirst.lk' + url
+                            url = config['base_url'] + url
+                        # The same article is often linked from several blocks
+                        key = _canonical_url(url)
+                        if key in seen_urls:
+                            continue
+                        seen_urls.add(key)
                         articles.append({
                             'title': title,
                             'url': url,
-                            'source': 'News First'
+                            'source': config['name']
                         })
                         count += 1
-                except:
+                except Exception:
                     continue
         except Exception as e:
-            print(f"Error scraping News First: {e}")
+            print(f"Error scraping {config['name']}: {e}")
         
         return articles
     
-    def scrape_economynext(self):
-        """Scrape Economy Next using RSS feed for reliability"""
+    def _scrape_feed(self, config):
+        """Scrape a source through its RSS feed (more reliable than the web page)"""
         articles = []
         try:
-            # Use RSS feed - more reliable than web scraping
-            feed = feedparser.parse('https://economynext.com/feed/')
+            body, validators = self._fetch_feed(config['feed_url'])
+            if body is None:
+                # Unchanged since the last stored response: its entries are already stored
+                return articles
+            feed = feedparser.parse(body)
             
             seen_titles = set()
+            seen_urls = set()
             for entry in feed.entries[:MAX_ARTICLES_PER_SOURCE]:
                 title = entry.get('title', '').strip()
                 url = entry.get('link', '')
+                key = _canonical_url(url)
                 
                 # Skip duplicates
-                if title and title not in seen_titles:
+                if title and title not in seen_titles and key not in seen_urls:
                     seen_titles.add(title)
+                    seen_urls.add(key)
                     articles.append({
                         'title': title,
                         'url': url,
-                        'source': 'Economy Next'
+                        'source': config['name']
                     })
-        except Exception as e:
-            print(f"Error scraping Economy Next: {e}")
-        
-        return articles
-    
-    def scrape_sundaytimes(self):
-        """Scrape Sunday Times"""
-        articles = []
-        try:
-            response = requests.get(
-                NEWS_SOURCES['sundaytimes']['url'],
-                headers=self.headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links
-            all_links = soup.find_all('a', href=True)
             
-            count = 0
-            for link in all_links:
-                if count >= MAX_ARTICLES_PER_SOURCE:
-                    break
-                try:
-                    title = link.get_text().strip()
-                    url = link.get('href', '')
-                    
-                    # Filter for news articles
-                    url = str(url) if url else ''
-                    if title and len(title) > 25 and url and ('article' in url or '202' in url):
-                        if not url.startswith('http'):
-                            url = 'https://www.sundaytimes.lk' + url
-                        articles.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'Sunday Times'
-                        })
-                        count += 1
-                except:
-                    continue
+            # Kept for a parsed feed only; scrape_all saves it once the entries are stored
+            if feed.entries and any(validators):
+                self.pending_validators[config['feed_url']] = validators
         except Exception as e:
-            print(f"Error scraping Sunday Times: {e}")
+            print(f"Error scraping {config['name']}: {e}")
         
         return articles
     
-    def scrape_ceylontoday(self):
-        """Scrape Ceylon Today"""
-        articles = []
-        try:
-            response = requests.get(
-                NEWS_SOURCES['ceylontoday']['url'],
-                headers=self.headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links
-            all_links = soup.find_all('a', href=True)
-            
-            count = 0
-            for link in all_links:
-                if count >= MAX_ARTICLES_PER_SOURCE:
-                    break
-                try:
-                    title = link.get_text().strip()
-                    url = link.get('href', '')
-                    
-                    # Filter for news articles
-                    url = str(url) if url else ''
-                    if title and len(title) > 25 and url and ('202' in url or '/news/' in url or '/category/' in url):
-                        if not url.startswith('http'):
-                            url = 'https://ceylontoday.lk' + url
-                        articles.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'Ceylon Today'
-                        })
-                        count += 1
-                except:
-                    continue
-        except Exception as e:
-            print(f"Error scraping Ceylon Today: {e}")
-        
-        return articles
-    
-    def scrape_businesstoday(self):
-        """Scrape Business Today using RSS feed for reliability"""
-        articles = []
-        try:
-            # Use RSS feed - more reliable and no duplicates
-            feed = feedparser.parse('https://businesstoday.lk/feed/')
-            
-            seen_titles = set()
-            for entry in feed.entries[:MAX_ARTICLES_PER_SOURCE]:
-                title = entry.get('title', '').strip()
-                url = entry.get('link', '')
-                
-                # Skip duplicates
-                if title and title not in seen_titles:
-                    seen_titles.add(title)
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'source': 'Business Today'
-                    })
-        except Exception as e:
-            print(f"Error scraping Business Today: {e}")
+    def scrape_all(self):
+        """Scrape all enabled news sources
         
-        return articles
-    
-    def scrape_lankabusinessonline(self):
-        """Scrape Lanka Business Online using RSS feed"""
-        articles = []
-        try:
-            # Use RSS feed for reliability
-            feed = feedparser.parse('https://www.lankabusinessonline.com/feed/')
-            
-            seen_titles = set()
-            for entry in feed.entries[:MAX_ARTICLES_PER_SOURCE]:
-                title = entry.get('title', '').strip()
-                url = entry.get('link', '')
-                
-                # Skip duplicates
-                if title and title not in seen_titles:
-                    seen_titles.add(title)
-                    articles.append({
-                        'title': title,
-                        'url': url,
-                        'source': 'Lanka Business Online'
-                    })
-        except Exception as e:
-            print(f"Error scraping Lanka Business Online: {e}")
+        Sources live on different hosts, so they are fetched concurrently (at most
+        SCRAPE_MAX_WORKERS at once) and the run takes about as long as the slowest
+        source. Results are then stored from the calling thread, which owns the
+        session, in one bulk insert.
+        """
+        all_articles = []
         
-        return articles
-    
-    def scrape_ft(self):
-        """Scrape Financial Times (web scraping - no RSS available)"""
-        articles = []
-        try:
-            response = requests.get(
-                NEWS_SOURCES['ft']['url'],
-                headers=self.headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links
-            all_links = soup.find_all('a', href=True)
-            
-            seen_titles = set()
-            count = 0
-            for link in all_links:
-                if count >= MAX_ARTICLES_PER_SOURCE:
-                    break
-                try:
-                    title = link.get_text().strip()
-                    url = link.get('href', '')
-                    
-                    # Filter for news articles
-                    url = str(url) if url else ''
-                    if title and len(title) > 25 and url and title not in seen_titles:
-                        # Check for article patterns
-                        if '202' in url or '/news/' in url or '/article/' in url or '/top-story/' in url:
-                            if not url.startswith('http'):
-                                url = 'https://www.ft.lk' + url
-                            seen_titles.add(title)
-                            articles.append({
-                                'title': title,
-                                'url': url,
-                                'source': 'Financial Times'
-                            })
-                            count += 1
-                except:
-                    continue
-        except Exception as e:
-            print(f"Error scraping Financial Times: {e}")
+        scrapers = {
+            'adaderana': self._scrape_adaderana,
+            'links': self._scrape_links,
+            'rss': self._scrape_feed,
+        }
+        enabled = [config for config in NEWS_SOURCES.values() if config['enabled']]
+        if not enabled:
+            return all_articles
         
-        return articles
-    
-    def scrape_newswire(self):
-        """Scrape News Wire"""
-        articles = []
-        try:
-            response = requests.get(
-                NEWS_SOURCES['newswire']['url'],
-                headers=self.headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Find all links
-            all_links = soup.find_all('a', href=True)
+        with ThreadPoolExecutor(max_workers=min(len(enabled), SCRAPE_MAX_WORKERS)) as pool:
+            # Call the source's scraper kind (sources without a known kind yield no articles)
+            pending = [
+                (config, pool.submit(scrapers.get(config.get('scraper'), lambda _config: []), config))
+                for config in enabled
+            ]
             
-            count = 0
-            for link in all_links:
-                if count >= MAX_ARTICLES_PER_SOURCE:
-                    break
-                try:
-                    title = link.get_text().strip()
-                    url = link.get('href', '')
-                    
-                    # Filter for news articles
-                    url = str(url) if url else ''
-                    if title and len(title) > 25 and url and ('202' in url or '/news/' in url or 'article' in url):
-                        if not url.startswith('http'):
-                            url = 'https://www.newswire.lk' + url
-                        articles.append({
-                            'title': title,
-                            'url': url,
-                            'source': 'News Wire'
-                        })
-                        count += 1
-                except:
-                    continue
-        except Exception as e:
-            print(f"Error scraping News Wire: {e}")
+            for source_config, future in pending:
+                articles = future.result()
+                
+                # Handle None returns
+                if articles is None:
+                    articles = []
+                
+                print(f"  {source_config['name']}: found {len(articles)} articles")
+                all_articles.extend(articles)
         
-        return articles
-    
-    def scrape_all(self):
-        """Scrape all enabled news sources"""
-        all_articles = []
+        # Store in database (duplicate URLs are skipped)
+        new_count = self.db.add_articles_bulk(all_articles)
+        print(f"  Stored {new_count} new of {len(all_articles)} articles")
         
-        for source_key, source_config in NEWS_SOURCES.items():
-            if not source_config['enabled']:
-                continue
-            
-            print(f"  Scraping {source_config['name']}...")
-            
-            # Call appropriate scraper
-            if source_key == 'adaderana':
-                articles = self.scrape_adaderana()
-            elif source_key == 'dailymirror':
-                articles = self.scrape_dailymirror()
-            elif source_key == 'newsfirst':
-                articles = self.scrape_newsfirst()
-            elif source_key == 'economynext':
-                articles = self.scrape_economynext()
-            elif source_key == 'sundaytimes':
-                articles = self.scrape_sundaytimes()
-            elif source_key == 'ceylontoday':
-                articles = self.scrape_ceylontoday()
-            elif source_key == 'businesstoday':
-                articles = self.scrape_businesstoday()
-            elif source_key == 'lankabusinessonline':
-                articles = self.scrape_lankabusinessonline()
-            elif source_key == 'ft':
-                articles = self.scrape_ft()
-            elif source_key == 'newswire':
-                articles = self.scrape_newswire()
-            else:
-                articles = []
-            
-            # Handle None returns
-            if articles is None:
-                articles = []
-            
-            # Store in database
-            new_count = 0
-            for article in articles:
-                article_id = self.db.add_article(
-                    title=article['title'],
-                    url=article['url'],
-                    source=article['source']
-                )
-                if article_id is not None:
-                    new_count += 1
-            
-            print(f"    Found {len(articles)} articles ({new_count} new)")
-            all_articles.extend(articles)
-            
-            # Polite delay between sources
-            time.sleep(SCRAPE_DELAY)
+        # Only now may later runs skip these feeds while they are unchanged
+        self.db.save_feed_validators(self.pending_validators)
+        self.feed_validators.update(self.pending_validators)
+        self.pending_validators = {}
         
         return all_articles
     
     def close(self):
-        """Close database connection"""
+        """Close HTTP and database connections"""
+        self.http.close()
         self.db.close()
@@ -3,55 +3,86 @@ Configuration settings for the Sri Lanka Business Intelligence Platform
 """
 
 # News sources to scrape
+# 'scraper' picks how a source is read: 'rss' parses 'feed_url'; 'links' keeps
+# front-page links whose URL contains one of 'link_filters' (relative URLs are
+# joined to 'base_url'; 'unique_titles' drops repeated titles); 'adaderana' is
+# Ada Derana's heading-based layout
 NEWS_SOURCES = {
     'adaderana': {
         'url': 'http://www.adaderana.lk/news.php',
         'name': 'Ada Derana',
+        'scraper': 'adaderana',
+        'base_url': 'http://www.adaderana.lk',
         'enabled': False  # General news - disabled
     },
     'dailymirror': {
         'url': 'https://www.dailymirror.lk/latest-news/159',
         'name': 'Daily Mirror',
+        'scraper': 'links',
+        'base_url': 'https://www.dailymirror.lk',
+        'link_filters': ('/news/', '/breaking-news/', '/latest-news/'),
         'enabled': False  # General news - disabled
     },
     'newsfirst': {
         'url': 'https://www.newsfirst.lk/',
         'name': 'News First',
+        'scraper': 'links',
+        'base_url': 'https://www.newsfirst.lk',
+        'link_filters': ('202',),
         'enabled': False  # General news - disabled
     },
     'economynext': {
         'url': 'https://economynext.com/',
         'name': 'Economy Next',
+        'scraper': 'rss',
+        'feed_url': 'https://economynext.com/feed/',
         'enabled': True  # Business/Economy focused
     },
     'sundaytimes': {
         'url': 'https://www.sundaytimes.lk/',
         'name': 'Sunday Times',
+        'scraper': 'links',
+        'base_url': 'https://www.sundaytimes.lk',
+        'link_filters': ('article', '202'),
         'enabled': False  # General news - disabled
     },
     'ceylontoday': {
         'url': 'https://ceylontoday.lk/',
         'name': 'Ceylon Today',
+        'scraper': 'links',
+        'base_url': 'https://ceylontoday.lk',
+        'link_filters': ('202', '/news/', '/category/'),
         'enabled': False  # General news - disabled
     },
     'businesstoday': {
         'url': 'https://businesstoday.lk/',
         'name': 'Business Today',
+        'scraper': 'rss',
+        'feed_url': 'https://businesstoday.lk/feed/',
         'enabled': True  # Business focused
     },
     'lankabusinessonline': {
         'url': 'https://www.lankabusinessonline.com/',
         'name': 'Lanka Business Online',
+        'scraper': 'rss',
+        'feed_url': 'https://www.lankabusinessonline.com/feed/',
         'enabled': True  # Business focused
     },
     'ft': {
         'url': 'https://www.ft.lk/',
         'name': 'Financial Times',
+        'scraper': 'links',
+        'base_url': 'https://www.ft.lk',
+        'link_filters': ('202', '/news/', '/article/', '/top-story/'),
+        'unique_titles': True,
         'enabled': True  # Business/Finance focused
     },
     'newswire': {
         'url': 'https://www.newswire.lk/',
         'name': 'News Wire',
+        'scraper': 'links',
+        'base_url': 'https://www.newswire.lk',
+        'link_filters': ('202', '/news/', 'article'),
         'enabled': False  # General news - disabled
     }
 }
@@ -205,8 +236,8 @@ OPPORTUNITY_KEYWORDS = [
 ]
 
 # Scraping settings
-SCRAPE_DELAY = 2  # Seconds between requests to the same source
 REQUEST_TIMEOUT = 10  # Seconds to wait for response
+SCRAPE_MAX_WORKERS = 8  # Sources fetched concurrently by NewsScraper.scrape_all
 MAX_ARTICLES_PER_SOURCE = 50  # Maximum articles to fetch per source
 
 # Database settings